@@ -6,27 +6,37 @@ GitHub: @m2-byte
 
 from flask import Flask, render_template, request, jsonify, make_response, send_from_directory, g
 from datetime import datetime, date, timedelta
-import requests
 import json
 import math
 import os
 import gzip
 import io
 import random
-import hashlib
 import logging
 import functools
+import threading
+
+from profiling import RequestProfiler
+from quran_store import QuranStore, EditionStore, VerseRow, DIVISIONS, BASE_EDITION
+from morphology import Morphology, to_arabic
+from daily import DailyContent, schedule as daily_schedule
+from surah_search import SurahIndex
+from http_cache import StaticVersions, cache_for
+from ratelimit import RateLimiter, UpstreamGate, UpstreamBusy, too_many_requests
+from sitemap import SitemapCache, render_urlset, render_index, paginate, page_count
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
-# Optional: Hijri Library
-try:
-    from hijri_converter import Hijri, Gregorian
-except ImportError:
-    Hijri = None
-    Gregorian = None
+# Optional: Hijri Library (imported on first use — see get_gregorian)
+@functools.lru_cache(maxsize=None)
+def get_gregorian():
+    try:
+        from hijri_converter import Gregorian
+        return Gregorian
+    except ImportError:
+        return None
 
 # ═══════════════════════════════════════════════════════════════
 #  CONFIGURATION & SETUP
@@ -34,9 +44,31 @@ except ImportError:
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-please-change-in-prod-12345'
-    DEBUG = True
+    # Never on in production: set FLASK_DEBUG=1 for local development
+    DEBUG = os.environ.get('FLASK_DEBUG', '0').lower() in ('1', 'true')
     CACHE_TYPE = 'simple'
     JSON_AS_ASCII = False
+    # Profiling (opt-in): send `X-Profile: <token>` or set a sample rate
+    PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN')
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    PROFILE_SLOW_MS = float(os.environ.get('PROFILE_SLOW_MS', 500))
+    PROFILE_BUFFER_SIZE = int(os.environ.get('PROFILE_BUFFER_SIZE', 50))
+    PROFILE_ENGINE = os.environ.get('PROFILE_ENGINE', 'cprofile')  # or 'pyinstrument'
+    # Admission control for upstream-proxying endpoints
+    RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') != '0'
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL')  # e.g. redis://localhost:6379/0
+    UPSTREAM_MAX_CONCURRENCY = int(os.environ.get('UPSTREAM_MAX_CONCURRENCY', 16))  # per worker
+    UPSTREAM_QUEUE_TIMEOUT = float(os.environ.get('UPSTREAM_QUEUE_TIMEOUT', 2))
+    # Number of reverse proxies in front of the app (for the client IP)
+    TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+    # Canonical base URL for sitemap and robots.txt links, e.g. https://example.org
+    SITE_URL = (os.environ.get('SITE_URL') or '').rstrip('/')
+    # spa5k/tafsir_api revision for Ibn Kathir / Saadi; set a commit hash to pin it
+    TAFSIR_API_REF = os.environ.get('TAFSIR_API_REF', 'main')
+    # Let wsgi.py download what data/ lacks before forking (delays boot until done)
+    PRELOAD_FETCH = os.environ.get('PRELOAD_FETCH', '0').lower() in ('1', 'true')
+    # Editions that download covers when data/quran lacks them
+    PRELOAD_EDITIONS = os.environ.get('PRELOAD_EDITIONS', 'en.sahih,ar.muyassar')
     # Social
     INSTAGRAM = '@m2_byte'
     GITHUB = '@m2-byte'
@@ -44,6 +76,19 @@ class Config:
 app = Flask(__name__)
 app.config.from_object(Config)
 
+if app.config['TRUSTED_PROXIES']:
+    from werkzeug.middleware.proxy_fix import ProxyFix
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXIES'], x_proto=app.config['TRUSTED_PROXIES'])
+
+# Registered before compress_response so its after_request hook runs last
+# and can see the compression span.
+profiler = RequestProfiler(app)
+
+limiter = RateLimiter(app)
+# Content-hashed ?v= on url_for('static', ...) and immutable static responses
+static_versions = StaticVersions(app)
+upstream_gate = UpstreamGate(app.config['UPSTREAM_MAX_CONCURRENCY'], app.config['UPSTREAM_QUEUE_TIMEOUT'])
+
 # ═══════════════════════════════════════════════════════════════
 #  PERFORMANCE & VIP FEATURES
 # ═══════════════════════════════════════════════════════════════
@@ -57,6 +102,9 @@ def compress_response(response):
     response.headers['X-XSS-Protection'] = '1; mode=block'
     response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
 
+    if 200 <= response.status_code < 300:
+        # Shared caches must keep gzipped and plain copies apart
+        response.vary.add('Accept-Encoding')
     accept_encoding = request.headers.get('Accept-Encoding', '')
     if response.status_code < 200 or response.status_code >= 300 or 'gzip' not in accept_encoding.lower() or 'Content-Encoding' in response.headers:
         return response
@@ -68,10 +116,11 @@ def compress_response(response):
     if len(content) < 500:
         return response
         
-    gzip_buffer = io.BytesIO()
-    gzip_file = gzip.GzipFile(mode='wb', fileobj=gzip_buffer)
-    gzip_file.write(content)
-    gzip_file.close()
+    with profiler.span('compress'):
+        gzip_buffer = io.BytesIO()
+        gzip_file = gzip.GzipFile(mode='wb', fileobj=gzip_buffer)
+        gzip_file.write(content)
+        gzip_file.close()
     
     response.set_data(gzip_buffer.getvalue())
     response.headers['Content-Encoding'] = 'gzip'
@@ -81,11 +130,39 @@ def compress_response(response):
 # CACHING — Improved with Error Handling & Session
 _cache = {}
 MAX_CACHE_SIZE = 500  # Prevent unbounded memory growth
-# Initialize a session for connection pooling and retries
-session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(max_retries=3)
-session.mount('https://', adapter)
-session.mount('http://', adapter)
+# Negative cache: url -> retry-not-before timestamp, so a URL that just
+# 404'd or failed is not fetched again on every request
+_negative_cache = {}
+NEGATIVE_TTL_NOT_FOUND = 600
+NEGATIVE_TTL_ERROR = 30
+# Session for connection pooling and retries. `requests` and its exception
+# classes are imported with it on first use, keeping them off the
+# import-time path.
+_session = None
+_session_lock = threading.Lock()
+RequestException = HTTPError = None
+
+def get_session():
+    global _session, RequestException, HTTPError
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.exceptions import RequestException, HTTPError
+                s = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(max_retries=3)
+                s.mount('https://', adapter)
+                s.mount('http://', adapter)
+                _session = s
+    return _session
+
+def close_session():
+    """Drop the pooled session, so a process forked afterwards opens its own."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
 
 def cached_get(url, ttl=3600, params=None):
     """
@@ -96,302 +173,165 @@ def cached_get(url, ttl=3600, params=None):
     now = datetime.now().timestamp()
     
     # Check cache
-    if cache_key in _cache:
-        data, ts = _cache[cache_key]
-        if now - ts < ttl:
-            return data
+    with profiler.span('cache'):
+        if cache_key in _cache:
+            data, ts = _cache[cache_key]
+            if now - ts < ttl:
+                return data
+        if _negative_cache.get(cache_key, 0) > now:
+            return _cache[cache_key][0] if cache_key in _cache else None
             
+    session = get_session()
     try:
-        r = session.get(url, params=params, timeout=10)
-        r.raise_for_status()
-        data = r.json()
+        with upstream_gate, profiler.span('upstream'):
+            r = session.get(url, params=params, timeout=10)
+            r.raise_for_status()
+            data = r.json()
         # Limit cache size
-        if len(_cache) >= MAX_CACHE_SIZE:
-            oldest_key = min(_cache, key=lambda k: _cache[k][1])
-            del _cache[oldest_key]
-        _cache[cache_key] = (data, now)
+        with profiler.span('cache'):
+            if len(_cache) >= MAX_CACHE_SIZE:
+                oldest_key = min(_cache, key=lambda k: _cache[k][1])
+                del _cache[oldest_key]
+            _cache[cache_key] = (data, now)
         return data
-    except requests.exceptions.RequestException as e:
+    except UpstreamBusy:
+        # Serve stale data rather than queue behind a saturated upstream
+        if cache_key in _cache:
+            return _cache[cache_key][0]
+        raise
+    except RequestException as e:
         logger.warning(f"API Error fetching {url}: {e}")
+        not_found = isinstance(e, HTTPError) and e.response is not None and e.response.status_code == 404
+        remember_failure(cache_key, NEGATIVE_TTL_NOT_FOUND if not_found else NEGATIVE_TTL_ERROR)
         # Fallback to expired cache if available
         if cache_key in _cache:
             return _cache[cache_key][0]
         return None
     except ValueError:
         logger.warning(f"API Error decoding JSON from {url}")
+        remember_failure(cache_key, NEGATIVE_TTL_ERROR)
         return None
 
-# DATA LOADING
+def remember_failure(cache_key, ttl):
+    now = datetime.now().timestamp()
+    if len(_negative_cache) >= MAX_CACHE_SIZE:
+        for k in [k for k, until in _negative_cache.items() if until <= now] or list(_negative_cache):
+            del _negative_cache[k]
+    _negative_cache[cache_key] = now + ttl
+
+def fetch_json(url, timeout=60):
+    """Uncached one-off fetch, for bulk corpus downloads that are kept elsewhere."""
+    with upstream_gate, profiler.span('upstream'):
+        r = get_session().get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+
+# DATA LOADING — parsed once, re-read only when the file's mtime changes
+_json_cache = {}
+
 def load_json(filename):
     filepath = os.path.join(os.path.dirname(__file__), 'data', filename)
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime = os.stat(filepath).st_mtime_ns
     except FileNotFoundError:
         return []
+    cached = _json_cache.get(filepath)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _json_cache[filepath] = (mtime, data)
+    return data
 
 # ═══════════════════════════════════════════════════════════════
 #  STATIC DATA
 # ═══════════════════════════════════════════════════════════════
 
-SURAHS_META = [
-    {"id":1,"name":"الفاتحة","name_en":"Al-Fatihah","meaning":"The Opening","verses":7,"type":"meccan"},
-    {"id":2,"name":"البقرة","name_en":"Al-Baqarah","meaning":"The Cow","verses":286,"type":"medinan"},
-    {"id":3,"name":"آل عمران","name_en":"Ali 'Imran","meaning":"Family of Imran","verses":200,"type":"medinan"},
-    {"id":4,"name":"النساء","name_en":"An-Nisa","meaning":"The Women","verses":176,"type":"medinan"},
-    {"id":5,"name":"المائدة","name_en":"Al-Ma'idah","meaning":"The Table Spread","verses":120,"type":"medinan"},
-    {"id":6,"name":"الأنعام","name_en":"Al-An'am","meaning":"The Cattle","verses":165,"type":"meccan"},
-    {"id":7,"name":"الأعراف","name_en":"Al-A'raf","meaning":"The Heights","verses":206,"type":"meccan"},
-    {"id":8,"name":"الأنفال","name_en":"Al-Anfal","meaning":"The Spoils of War","verses":75,"type":"medinan"},
-    {"id":9,"name":"التوبة","name_en":"At-Tawbah","meaning":"The Repentance","verses":129,"type":"medinan"},
-    {"id":10,"name":"يونس","name_en":"Yunus","meaning":"Jonah","verses":109,"type":"meccan"},
-    {"id":11,"name":"هود","name_en":"Hud","meaning":"Hud","verses":123,"type":"meccan"},
-    {"id":12,"name":"يوسف","name_en":"Yusuf","meaning":"Joseph","verses":111,"type":"meccan"},
-    {"id":13,"name":"الرعد","name_en":"Ar-Ra'd","meaning":"The Thunder","verses":43,"type":"medinan"},
-    {"id":14,"name":"إبراهيم","name_en":"Ibrahim","meaning":"Abraham","verses":52,"type":"meccan"},
-    {"id":15,"name":"الحجر","name_en":"Al-Hijr","meaning":"The Rocky Tract","verses":99,"type":"meccan"},
-    {"id":16,"name":"النحل","name_en":"An-Nahl","meaning":"The Bee","verses":128,"type":"meccan"},
-    {"id":17,"name":"الإسراء","name_en":"Al-Isra","meaning":"The Night Journey","verses":111,"type":"meccan"},
-    {"id":18,"name":"الكهف","name_en":"Al-Kahf","meaning":"The Cave","verses":110,"type":"meccan"},
-    {"id":19,"name":"مريم","name_en":"Maryam","meaning":"Mary","verses":98,"type":"meccan"},
-    {"id":20,"name":"طه","name_en":"Taha","meaning":"Ta-Ha","verses":135,"type":"meccan"},
-    {"id":21,"name":"الأنبياء","name_en":"Al-Anbiya","meaning":"The Prophets","verses":112,"type":"meccan"},
-    {"id":22,"name":"الحج","name_en":"Al-Hajj","meaning":"The Pilgrimage","verses":78,"type":"medinan"},
-    {"id":23,"name":"المؤمنون","name_en":"Al-Mu'minun","meaning":"The Believers","verses":118,"type":"meccan"},
-    {"id":24,"name":"النور","name_en":"An-Nur","meaning":"The Light","verses":64,"type":"medinan"},
-    {"id":25,"name":"الفرقان","name_en":"Al-Furqan","meaning":"The Criterion","verses":77,"type":"meccan"},
-    {"id":26,"name":"الشعراء","name_en":"Ash-Shu'ara","meaning":"The Poets","verses":227,"type":"meccan"},
-    {"id":27,"name":"النمل","name_en":"An-Naml","meaning":"The Ant","verses":93,"type":"meccan"},
-    {"id":28,"name":"القصص","name_en":"Al-Qasas","meaning":"The Stories","verses":88,"type":"meccan"},
-    {"id":29,"name":"العنكبوت","name_en":"Al-Ankabut","meaning":"The Spider","verses":69,"type":"meccan"},
-    {"id":30,"name":"الروم","name_en":"Ar-Rum","meaning":"The Romans","verses":60,"type":"meccan"},
-    {"id":31,"name":"لقمان","name_en":"Luqman","meaning":"Luqman","verses":34,"type":"meccan"},
-    {"id":32,"name":"السجدة","name_en":"As-Sajdah","meaning":"The Prostration","verses":30,"type":"meccan"},
-    {"id":33,"name":"الأحزاب","name_en":"Al-Ahzab","meaning":"The Combined Forces","verses":73,"type":"medinan"},
-    {"id":34,"name":"سبأ","name_en":"Saba","meaning":"Sheba","verses":54,"type":"meccan"},
-    {"id":35,"name":"فاطر","name_en":"Fatir","meaning":"Originator","verses":45,"type":"meccan"},
-    {"id":36,"name":"يس","name_en":"Ya-Sin","meaning":"Ya Sin","verses":83,"type":"meccan"},
-    {"id":37,"name":"الصافات","name_en":"As-Saffat","meaning":"Those Ranged in Ranks","verses":182,"type":"meccan"},
-    {"id":38,"name":"ص","name_en":"Sad","meaning":"The Letter Sad","verses":88,"type":"meccan"},
-    {"id":39,"name":"الزمر","name_en":"Az-Zumar","meaning":"The Groups","verses":75,"type":"meccan"},
-    {"id":40,"name":"غافر","name_en":"Ghafir","meaning":"The Forgiver","verses":85,"type":"meccan"},
-    {"id":41,"name":"فصلت","name_en":"Fussilat","meaning":"Explained in Detail","verses":54,"type":"meccan"},
-    {"id":42,"name":"الشورى","name_en":"Ash-Shura","meaning":"The Consultation","verses":53,"type":"meccan"},
-    {"id":43,"name":"الزخرف","name_en":"Az-Zukhruf","meaning":"The Ornaments of Gold","verses":89,"type":"meccan"},
-    {"id":44,"name":"الدخان","name_en":"Ad-Dukhan","meaning":"The Smoke","verses":59,"type":"meccan"},
-    {"id":45,"name":"الجاثية","name_en":"Al-Jathiyah","meaning":"The Crouching","verses":37,"type":"meccan"},
-    {"id":46,"name":"الأحقاف","name_en":"Al-Ahqaf","meaning":"The Wind-Curved Sandhills","verses":35,"type":"meccan"},
-    {"id":47,"name":"محمد","name_en":"Muhammad","meaning":"Muhammad","verses":38,"type":"medinan"},
-    {"id":48,"name":"الفتح","name_en":"Al-Fath","meaning":"The Victory","verses":29,"type":"medinan"},
-    {"id":49,"name":"الحجرات","name_en":"Al-Hujurat","meaning":"The Rooms","verses":18,"type":"medinan"},
-    {"id":50,"name":"ق","name_en":"Qaf","meaning":"The Letter Qaf","verses":45,"type":"meccan"},
-    {"id":51,"name":"الذاريات","name_en":"Adh-Dhariyat","meaning":"The Winnowing Winds","verses":60,"type":"meccan"},
-    {"id":52,"name":"الطور","name_en":"At-Tur","meaning":"The Mount","verses":49,"type":"meccan"},
-    {"id":53,"name":"النجم","name_en":"An-Najm","meaning":"The Star","verses":62,"type":"meccan"},
-    {"id":54,"name":"القمر","name_en":"Al-Qamar","meaning":"The Moon","verses":55,"type":"meccan"},
-    {"id":55,"name":"الرحمن","name_en":"Ar-Rahman","meaning":"The Beneficent","verses":78,"type":"medinan"},
-    {"id":56,"name":"الواقعة","name_en":"Al-Waqi'ah","meaning":"The Inevitable","verses":96,"type":"meccan"},
-    {"id":57,"name":"الحديد","name_en":"Al-Hadid","meaning":"The Iron","verses":29,"type":"medinan"},
-    {"id":58,"name":"المجادلة","name_en":"Al-Mujadila","meaning":"She That Disputeth","verses":22,"type":"medinan"},
-    {"id":59,"name":"الحشر","name_en":"Al-Hashr","meaning":"The Exile","verses":24,"type":"medinan"},
-    {"id":60,"name":"الممتحنة","name_en":"Al-Mumtahanah","meaning":"She That Is Examined","verses":13,"type":"medinan"},
-    {"id":61,"name":"الصف","name_en":"As-Saf","meaning":"The Ranks","verses":14,"type":"medinan"},
-    {"id":62,"name":"الجمعة","name_en":"Al-Jumu'ah","meaning":"The Congregation","verses":11,"type":"medinan"},
-    {"id":63,"name":"المنافقون","name_en":"Al-Munafiqun","meaning":"The Hypocrites","verses":11,"type":"medinan"},
-    {"id":64,"name":"التغابن","name_en":"At-Taghabun","meaning":"The Mutual Disillusion","verses":18,"type":"medinan"},
-    {"id":65,"name":"الطلاق","name_en":"At-Talaq","meaning":"The Divorce","verses":12,"type":"medinan"},
-    {"id":66,"name":"التحريم","name_en":"At-Tahrim","meaning":"The Prohibition","verses":12,"type":"medinan"},
-    {"id":67,"name":"الملك","name_en":"Al-Mulk","meaning":"The Sovereignty","verses":30,"type":"meccan"},
-    {"id":68,"name":"القلم","name_en":"Al-Qalam","meaning":"The Pen","verses":52,"type":"meccan"},
-    {"id":69,"name":"الحاقة","name_en":"Al-Haqqah","meaning":"The Reality","verses":52,"type":"meccan"},
-    {"id":70,"name":"المعارج","name_en":"Al-Ma'arij","meaning":"The Ascending Stairways","verses":44,"type":"meccan"},
-    {"id":71,"name":"نوح","name_en":"Nuh","meaning":"Noah","verses":28,"type":"meccan"},
-    {"id":72,"name":"الجن","name_en":"Al-Jinn","meaning":"The Jinn","verses":28,"type":"meccan"},
-    {"id":73,"name":"المزمل","name_en":"Al-Muzzammil","meaning":"The Enshrouded One","verses":20,"type":"meccan"},
-    {"id":74,"name":"المدثر","name_en":"Al-Muddaththir","meaning":"The Cloaked One","verses":56,"type":"meccan"},
-    {"id":75,"name":"القيامة","name_en":"Al-Qiyamah","meaning":"The Resurrection","verses":40,"type":"meccan"},
-    {"id":76,"name":"الإنسان","name_en":"Al-Insan","meaning":"The Man","verses":31,"type":"medinan"},
-    {"id":77,"name":"المرسلات","name_en":"Al-Mursalat","meaning":"The Emissaries","verses":50,"type":"meccan"},
-    {"id":78,"name":"النبأ","name_en":"An-Naba","meaning":"The Tidings","verses":40,"type":"meccan"},
-    {"id":79,"name":"النازعات","name_en":"An-Nazi'at","meaning":"Those Who Drag Forth","verses":46,"type":"meccan"},
-    {"id":80,"name":"عبس","name_en":"Abasa","meaning":"He Frowned","verses":42,"type":"meccan"},
-    {"id":81,"name":"التكوير","name_en":"At-Takwir","meaning":"The Overthrowing","verses":29,"type":"meccan"},
-    {"id":82,"name":"الانفطار","name_en":"Al-Infitar","meaning":"The Cleaving","verses":19,"type":"meccan"},
-    {"id":83,"name":"المطففين","name_en":"Al-Mutaffifin","meaning":"Defrauding","verses":36,"type":"meccan"},
-    {"id":84,"name":"الانشقاق","name_en":"Al-Inshiqaq","meaning":"The Sundering","verses":25,"type":"meccan"},
-    {"id":85,"name":"البروج","name_en":"Al-Buruj","meaning":"The Mansions of the Stars","verses":22,"type":"meccan"},
-    {"id":86,"name":"الطارق","name_en":"At-Tariq","meaning":"The Nightcomer","verses":17,"type":"meccan"},
-    {"id":87,"name":"الأعلى","name_en":"Al-A'la","meaning":"The Most High","verses":19,"type":"meccan"},
-    {"id":88,"name":"الغاشية","name_en":"Al-Ghashiyah","meaning":"The Overwhelming","verses":26,"type":"meccan"},
-    {"id":89,"name":"الفجر","name_en":"Al-Fajr","meaning":"The Dawn","verses":30,"type":"meccan"},
-    {"id":90,"name":"البلد","name_en":"Al-Balad","meaning":"The City","verses":20,"type":"meccan"},
-    {"id":91,"name":"الشمس","name_en":"Ash-Shams","meaning":"The Sun","verses":15,"type":"meccan"},
-    {"id":92,"name":"الليل","name_en":"Al-Layl","meaning":"The Night","verses":21,"type":"meccan"},
-    {"id":93,"name":"الضحى","name_en":"Ad-Duhaa","meaning":"The Morning Hours","verses":11,"type":"meccan"},
-    {"id":94,"name":"الشرح","name_en":"Ash-Sharh","meaning":"The Relief","verses":8,"type":"meccan"},
-    {"id":95,"name":"التين","name_en":"At-Tin","meaning":"The Fig","verses":8,"type":"meccan"},
-    {"id":96,"name":"العلق","name_en":"Al-Alaq","meaning":"The Clot","verses":19,"type":"meccan"},
-    {"id":97,"name":"القدر","name_en":"Al-Qadr","meaning":"The Power","verses":5,"type":"meccan"},
-    {"id":98,"name":"البينة","name_en":"Al-Bayyinah","meaning":"The Clear Proof","verses":8,"type":"medinan"},
-    {"id":99,"name":"الزلزلة","name_en":"Az-Zalzalah","meaning":"The Earthquake","verses":8,"type":"medinan"},
-    {"id":100,"name":"العاديات","name_en":"Al-Adiyat","meaning":"The Chargers","verses":11,"type":"meccan"},
-    {"id":101,"name":"القارعة","name_en":"Al-Qari'ah","meaning":"The Calamity","verses":11,"type":"meccan"},
-    {"id":102,"name":"التكاثر","name_en":"At-Takathur","meaning":"The Rivalry in Worldly Increase","verses":8,"type":"meccan"},
-    {"id":103,"name":"العصر","name_en":"Al-Asr","meaning":"The Declining Day","verses":3,"type":"meccan"},
-    {"id":104,"name":"الهمزة","name_en":"Al-Humazah","meaning":"The Traducer","verses":9,"type":"meccan"},
-    {"id":105,"name":"الفيل","name_en":"Al-Fil","meaning":"The Elephant","verses":5,"type":"meccan"},
-    {"id":106,"name":"قريش","name_en":"Quraysh","meaning":"Quraysh","verses":4,"type":"meccan"},
-    {"id":107,"name":"الماعون","name_en":"Al-Ma'un","meaning":"The Small Kindnesses","verses":7,"type":"meccan"},
-    {"id":108,"name":"الكوثر","name_en":"Al-Kawthar","meaning":"The Abundance","verses":3,"type":"meccan"},
-    {"id":109,"name":"الكافرون","name_en":"Al-Kafirun","meaning":"The Disbelievers","verses":6,"type":"meccan"},
-    {"id":110,"name":"النصر","name_en":"An-Nasr","meaning":"The Divine Support","verses":3,"type":"medinan"},
-    {"id":111,"name":"المسد","name_en":"Al-Masad","meaning":"The Palm Fiber","verses":5,"type":"meccan"},
-    {"id":112,"name":"الإخلاص","name_en":"Al-Ikhlas","meaning":"The Sincerity","verses":4,"type":"meccan"},
-    {"id":113,"name":"الفلق","name_en":"Al-Falaq","meaning":"The Daybreak","verses":5,"type":"meccan"},
-    {"id":114,"name":"الناس","name_en":"An-Nas","meaning":"Mankind","verses":6,"type":"meccan"},
-]
-
-HADITH_COLLECTIONS = [
-    {"id": "ara-bukhari", "name": "صحيح البخاري", "name_en": "Sahih al-Bukhari", "author": "الإمام البخاري", "count": "7563"},
-    {"id": "ara-muslim", "name": "صحيح مسلم", "name_en": "Sahih Muslim", "author": "الإمام مسلم", "count": "5362"},
-    {"id": "ara-abudawud", "name": "سنن أبي داود", "name_en": "Sunan Abu Dawud", "author": "أبو داود", "count": "4590"},
-    {"id": "ara-tirmidhi", "name": "جامع الترمذي", "name_en": "Jami at-Tirmidhi", "author": "الإمام الترمذي", "count": "3891"},
-    {"id": "ara-nasai", "name": "سنن النسائي", "name_en": "Sunan an-Nasa'i", "author": "الإمام النسائي", "count": "5662"},
-    {"id": "ara-ibnmajah", "name": "سنن ابن ماجه", "name_en": "Sunan Ibn Majah", "author": "ابن ماجه", "count": "4332"},
-]
-
-TRANSLATION_MAP = {
-    'en.sahih': 'English — Saheeh International',
-    'en.hilali': 'English — Hilali & Khan',
-    'fr.hamidullah': 'Français — Hamidullah',
-    'ur.jalandhry': 'اردو — Jalandhry',
-    'tr.diyanet': 'Türkçe — Diyanet',
-    'id.indonesian': 'Bahasa Indonesia',
-    'de.bubenheim': 'Deutsch — Bubenheim',
-    'es.cortes': 'Español — Cortes',
-    'ru.kuliev': 'Русский — Kuliev',
-    'bn.bengali': 'বাংলা — Bengali',
-}
-
-RECITERS = [
-    {"id": "ar.alafasy", "name": "مشاري العفاسي", "name_en": "Mishary Rashid Alafasy"},
-    {"id": "ar.abdulbasitmurattal", "name": "عبد الباسط عبد الصمد", "name_en": "Abdul Basit (Murattal)"},
-    {"id": "ar.abdullahbasfar", "name": "عبدالله بصفر", "name_en": "Abdullah Basfar"},
-    {"id": "ar.hudhaify", "name": "الحذيفي", "name_en": "Ali Al-Hudhaifi"},
-    {"id": "ar.husary", "name": "محمود خليل الحصري", "name_en": "Mahmoud Khalil Al-Husary"},
-    {"id": "ar.mahermuaiqly", "name": "ماهر المعيقلي", "name_en": "Maher Al Muaiqly"},
-    {"id": "ar.abdurrahmaansudais", "name": "عبدالرحمن السديس", "name_en": "Abdurrahmaan As-Sudais"},
-    {"id": "ar.saoodshuraym", "name": "سعود الشريم", "name_en": "Saood Ash-Shuraym"},
-]
-
-# Arabic translations for Hadith section names (API returns English)
-HADITH_SECTIONS_AR = {
-    # Sahih al-Bukhari
-    "Revelation": "بدء الوحي",
-    "Belief": "الإيمان",
-    "Knowledge": "العلم",
-    "Ablutions (Wudu')": "الوضوء",
-    "Bathing (Ghusl)": "الغسل",
-    "Menstrual Periods": "الحيض",
-    "Rubbing hands and feet with dust (Tayammum)": "التيمم",
-    "Prayers (Salat)": "الصلاة",
-    "Times of the Prayers": "مواقيت الصلاة",
-    "Call to Prayers (Adhaan)": "الأذان",
-    "Friday Prayer": "الجمعة",
-    "Fear Prayer": "صلاة الخوف",
-    "The Two Festivals (Eids)": "العيدين",
-    "Witr Prayer": "الوتر",
-    "Invoking Allah for Rain (Istisqaa)": "الاستسقاء",
-    "Eclipses": "الكسوف",
-    "Prostration During Recital of Qur'an": "سجود القرآن",
-    "Shortening the Prayers (At-Taqseer)": "تقصير الصلاة",
-    "Prayer at Night (Tahajjud)": "التهجد",
-    "Virtues of Prayer at Masjid Makkah and Madinah": "فضل الصلاة في مسجد مكة والمدينة",
-    "Actions while Praying": "العمل في الصلاة",
-    "Forgetfulness in Prayer": "السهو",
-    "Funerals (Al-Janaa'iz)": "الجنائز",
-    "Obligatory Charity Tax (Zakat)": "الزكاة",
-    "Hajj (Pilgrimage)": "الحج",
-    "`Umrah (Minor pilgrimage)": "العمرة",
-    "Pilgrims Prevented from Completing the Pilgrimage": "المحصر",
-    "Penalty of Hunting while on Pilgrimage": "جزاء الصيد",
-    "Virtues of Madinah": "فضائل المدينة",
-    "Fasting": "الصيام",
-    "Praying at Night in Ramadaan (Taraweeh)": "التراويح",
-    "Virtues of the Night of Qadr": "فضل ليلة القدر",
-    "Retiring to a Mosque for Remembrance of Allah (I'tikaf)": "الاعتكاف",
-    "Sales and Trade": "البيوع",
-    "Hiring": "الإجارة",
-    "Agriculture": "المزارعة",
-    "Gifts": "الهبة",
-    "Witnesses": "الشهادات",
-    "Peacemaking": "الصلح",
-    "Wills and Testaments (Wasaayaa)": "الوصايا",
-    "Fighting for the Cause of Allah (Jihaad)": "الجهاد والسير",
-    "Beginning of Creation": "بدء الخلق",
-    "Prophets": "الأنبياء",
-    "Virtues and Merits of the Prophet (pbuh) and his Companions": "المناقب",
-    "Companions of the Prophet": "أصحاب النبي ﷺ",
-    "Merits of the Helpers in Madinah (Ansaar)": "مناقب الأنصار",
-    "Military Expeditions led by the Prophet (pbuh) (Al-Maghaazi)": "المغازي",
-    "Prophetic Commentary on the Qur'an (Tafseer of the Prophet (pbuh))": "التفسير",
-    "Virtues of the Qur'an": "فضائل القرآن",
-    "Wedlock, Marriage (Nikaah)": "النكاح",
-    "Divorce": "الطلاق",
-    "Supporting the Family": "النفقات",
-    "Food, Meals": "الأطعمة",
-    "Hunting, Slaughtering": "الصيد والذبائح",
-    "Drinks": "الأشربة",
-    "Patients": "المرضى",
-    "Medicine": "الطب",
-    "Dress": "اللباس",
-    "Good Manners and Form (Al-Adab)": "الأدب",
-    "Asking Permission": "الاستئذان",
-    "Invocations": "الدعوات",
-    "To make the Heart Tender (Ar-Riqaq)": "الرقاق",
-    "Divine Will (Al-Qadar)": "القدر",
-    "Oaths and Vows": "الأيمان والنذور",
-    "Laws of Inheritance (Al-Faraa'id)": "الفرائض",
-    "Limits and Punishments set by Allah (Hudood)": "الحدود",
-    "Blood Money (Ad-Diyat)": "الديات",
-    "Apostates": "المرتدين",
-    "Interpretation of Dreams": "تعبير الرؤيا",
-    "Afflictions and the End of the World": "الفتن",
-    "Judgments (Ahkaam)": "الأحكام",
-    "Holding Fast to the Qur'an and Sunnah": "الاعتصام بالكتاب والسنة",
-    "Oneness, Uniqueness of Allah (Tawheed)": "التوحيد",
-    # Sahih Muslim
-    "Introduction": "المقدمة",
-    "Faith": "الإيمان",
-    "Purification (Kitab Al-Taharah)": "الطهارة",
-    "Menstruation": "الحيض",
-    "Prayer": "الصلاة",
-    "Zakat": "الزكاة",
-    "Fasts": "الصيام",
-    "Pilgrimage": "الحج",
-    "Marriage": "النكاح",
-    "Suckling": "الرضاع",
-    "Transactions": "البيوع",
-    "Inheritance": "الفرائض",
-    "Gifts": "الهبة",
-    "Oaths": "الأيمان",
-    "Vows": "النذور",
-    "Oaths in Courts": "القسامة والمحاربين",
-    "Punishments": "الحدود",
-    "Hunting and Slaughter": "الصيد والذبائح",
-    "Food and Drink": "الأشربة",
-    "Clothing and Adornments": "اللباس والزينة",
-    "Jihad": "الجهاد والسير",
-    "Government": "الإمارة",
-    "Virtue, Enjoining Good Manners": "البر والصلة والآداب",
-    "Destiny": "القدر",
-    "Knowledge": "العلم",
-    "Remembrance of Allah": "الذكر والدعاء",
-    "Heart Melting Traditions": "التوبة",
-    "Paradise": "الجنة وصفة نعيمها وأهلها",
-    "Tribulations": "الفتن وأشراط الساعة",
-    "Commentary on the Quran": "تفسير القرآن",
-}
+from tables import SURAHS_META, SURAH_ALIASES, HADITH_COLLECTIONS, TRANSLATION_MAP, TAFSIR_MAP, TAFSIR_SOURCES, RECITERS, HADITH_SECTIONS_AR
+
+# Whole-Quran text + juz/hizb/page boundary index (see quran_store.py)
+verse_store = QuranStore(SURAHS_META)
+# Translation/tafsir columns aligned with it, loaded per edition on first use
+edition_store = EditionStore()
+# Word-level lemma/root/POS index (see morphology.py), built on first lookup
+morphology = Morphology(verse_store.surah_starts)
+PARALLEL_EDITIONS = {**TRANSLATION_MAP, **TAFSIR_MAP}
+MAX_PARALLEL_EDITIONS = 4
+DEFAULT_TAFSIR = 'ar.muyassar'
+
+# Request handlers only read what the stores already hold. A corpus that is
+# not loaded yet is fetched by a background thread, and until it lands the
+# handlers fall back to per-surah / per-division API calls.
+_store_loads = set()
+_store_loads_lock = threading.Lock()
+
+def load_in_background(name, load):
+    """Run `load()` in a daemon thread, unless one for `name` is already running."""
+    with _store_loads_lock:
+        if name in _store_loads:
+            return
+        _store_loads.add(name)
+
+    def run():
+        try:
+            load()
+        except UpstreamBusy:
+            pass  # No fetch slot free; the next request tries again
+        except Exception as e:
+            logger.warning(f"Background load of {name} failed: {e}")
+        finally:
+            with _store_loads_lock:
+                _store_loads.discard(name)
+
+    threading.Thread(target=run, name=f"load-{name}", daemon=True).start()
+
+def quran_text():
+    """The verse store's text column, or None while it loads in the background."""
+    if not verse_store.loaded:
+        load_in_background(BASE_EDITION, lambda: verse_store.ensure_loaded(fetch_json, busy=UpstreamBusy))
+        return None
+    return verse_store.text
+
+def edition_column(edition):
+    """Store column for `edition`, or None while it loads in the background.
+    Editions with their own per-surah source have no corpus endpoint, so
+    they come only from local files (read by preload)."""
+    column = edition_store.columns.get(edition)
+    if column is None and edition not in TAFSIR_SOURCES:
+        load_in_background(edition, lambda: edition_store.get(edition, fetch_json, busy=UpstreamBusy))
+    return column
+
+def surah_edition_texts(surah_id, edition=None):
+    """One edition's texts for a surah from its per-surah API (cached),
+    indexed by ayah number; ayat the source lacks are left empty."""
+    if edition in TAFSIR_SOURCES:
+        url = TAFSIR_SOURCES[edition].format(ref=app.config['TAFSIR_API_REF'], surah=surah_id)
+    else:
+        url = f"https://api.alquran.cloud/v1/surah/{surah_id}" + (f"/{edition}" if edition else '')
+    data = cached_get(url, ttl=86400) # Cache for 24h
+    if not data:
+        return []
+    ayahs = data.get('ayahs') or (data.get('data') or {}).get('ayahs') or []
+    # Tafsir files number ayat as `ayah`, alquran.cloud as `numberInSurah`
+    texts = {a.get('ayah') or a.get('numberInSurah'): a.get('text', '') for a in ayahs}
+    if not texts:
+        return []
+    return [texts.get(n, '') for n in range(1, SURAHS_META[surah_id - 1]['verses'] + 1)]
+
+
+RECITER_IDS = frozenset(r['id'] for r in RECITERS)
+
+
+def valid_ayah(surah, ayah):
+    """True if `ayah` exists in `surah` (1-based ints; None fails)."""
+    return (isinstance(surah, int) and isinstance(ayah, int) and 1 <= surah <= 114
+            and 1 <= ayah <= SURAHS_META[surah - 1]['verses'])
+
+
+@functools.lru_cache(maxsize=None)
+def get_surah_index():
+    """Trigram index for surah lookup, built on first search."""
+    return SurahIndex(SURAHS_META, SURAH_ALIASES)
 
 
 def translate_section_name(name):
@@ -403,11 +343,9 @@ def translate_section_name(name):
 #  HELPERS
 # ═══════════════════════════════════════════════════════════════
 
-def get_today_verse_index(max_val):
-    """Generate a deterministic index for today without polluting global random state."""
-    d = date.today().isoformat()
-    h = int(hashlib.md5(d.encode()).hexdigest(), 16)
-    return h % max_val
+def seconds_until_midnight():
+    now = datetime.now()
+    return int((datetime.combine(now.date() + timedelta(days=1), datetime.min.time()) - now).total_seconds()) + 1
 
 # ═══════════════════════════════════════════════════════════════
 #  FILTERS
@@ -436,7 +374,7 @@ def quran_index():
     search = request.args.get('q', '').strip()
     filtered = SURAHS_META
     if search:
-        filtered = [s for s in SURAHS_META if search.lower() in s['name_en'].lower() or search in s['name'] or search in str(s['id'])]
+        filtered = [s for s, _ in get_surah_index().search(search, len(SURAHS_META))]
     return render_template('quran/index.html',
         surahs=filtered,
         search_query=search,
@@ -444,92 +382,210 @@ def quran_index():
         description="تصفح المصحف الشريف بالكامل. استمع وتدبر آيات الله مع الترجمة والتفسير."
     )
 
-@app.route('/quran/juz/<int:juz_id>')
-def quran_juz(juz_id):
-    if juz_id < 1 or juz_id > 30:
-        return render_template('404.html'), 404
-        
-    # Get Juz data
-    url = f"https://api.alquran.cloud/v1/juz/{juz_id}/quran-uthmani"
-    data = cached_get(url)
-    
-    if not data or data.get('code') != 200:
-        return render_template('404.html'), 500
-        
+DIVISION_LABELS = {'juz': 'الجزء', 'hizb': 'الحزب', 'page': 'الصفحة'}
+
+
+def render_division(kind, number, groups):
+    """Render a juz / hizb / page view from ayat grouped by surah."""
+    label = DIVISION_LABELS[kind]
+    return render_template('quran/juz.html',
+                          section={'kind': kind, 'label': label, 'number': number, 'total': DIVISIONS[kind]},
+                          groups=groups,
+                          title=f"{label} {number} — القرآن الكريم",
+                          description=f"قراءة واستماع آيات {label} {number} كاملاً.")
+
+
+def division_upstream(kind, number):
+    """Ayat of a juz / hizb / page from the API, grouped by surah, or None."""
+    if kind == 'hizb':
+        paths = [f"hizbQuarter/{q}" for q in range(4 * number - 3, 4 * number + 1)]
+    else:
+        paths = [f"{kind}/{number}"]
+    ayahs = []
+    for path in paths:
+        data = cached_get(f"https://api.alquran.cloud/v1/{path}/quran-uthmani")
+        if not data or data.get('code') != 200:
+            return None
+        ayahs.extend(data['data']['ayahs'])
+
     # Process verses to group by Surah (since a Juz contains parts of Surahs)
-    juz_data = data['data']
-    verses = juz_data['ayahs']
-    
-    # Structure: { surah_number: { name: "...", verses: [...] } }
-    grouped_verses = {}
-    surah_order = [] # To keep order
-    
-    for v in verses:
+    groups = []
+    for v in ayahs:
         s_num = v['surah']['number']
-        if s_num not in grouped_verses:
-            grouped_verses[s_num] = {
+        if not groups or groups[-1]['number'] != s_num:
+            groups.append({
                 'name': v['surah']['name'],
                 'englishName': v['surah']['englishName'],
                 'number': s_num,
                 'verses': []
-            }
-            surah_order.append(s_num)
+            })
         
         # Add verse
-        grouped_verses[s_num]['verses'].append({
+        groups[-1]['verses'].append({
             'number': v['numberInSurah'],
             'text': v['text'],
             'audio': f"https://cdn.islamic.network/quran/audio/128/ar.alafasy/{v['number']}.mp3", # Global number for audio
             'global_number': v['number']
         })
-        
-    return render_template('quran/juz.html',
-                          juz_id=juz_id,
-                          grouped_verses=grouped_verses,
-                          surah_order=surah_order,
-                          title=f"الجزء {juz_id} — القرآن الكريم",
-                          description=f"قراءة واستماع آيات الجزء {juz_id} كاملاً.")
+    return groups
+
+
+def render_division_view(kind, number):
+    """Slice the division out of the verse store when its text is loaded,
+    otherwise fetch just that division from the API."""
+    bounds = verse_store.bounds(kind, number) if quran_text() is not None else None
+    groups = verse_store.grouped(*bounds) if bounds else division_upstream(kind, number)
+    if groups is None:
+        return render_template('404.html'), 500
+    return render_division(kind, number, groups)
+
+
+@app.route('/quran/juz/<int:juz_id>')
+@cache_for(300, stale_while_revalidate=86400)
+def quran_juz(juz_id):
+    if juz_id < 1 or juz_id > 30:
+        return render_template('404.html'), 404
+
+    return render_division_view('juz', juz_id)
+
+@app.route('/quran/hizb/<int:hizb_id>')
+@cache_for(300, stale_while_revalidate=86400)
+def quran_hizb(hizb_id):
+    if hizb_id < 1 or hizb_id > DIVISIONS['hizb']:
+        return render_template('404.html'), 404
+    return render_division_view('hizb', hizb_id)
+
+@app.route('/quran/page/<int:page>')
+@cache_for(300, stale_while_revalidate=86400)
+def quran_page(page):
+    if page < 1 or page > DIVISIONS['page']:
+        return render_template('404.html'), 404
+    return render_division_view('page', page)
+
+def parse_editions(value):
+    """`a,b,c` -> known editions, deduplicated, in the order given."""
+    editions = []
+    for e in value.split(','):
+        e = e.strip()
+        if e in PARALLEL_EDITIONS and e not in editions:
+            editions.append(e)
+    return editions[:MAX_PARALLEL_EDITIONS]
+
+def surah_rows(surah_id, editions):
+    """VerseRows from the in-memory stores, or None if any column is not loaded yet."""
+    text = quran_text()
+    columns = [edition_column(e) for e in editions]
+    if text is None or None in columns:
+        return None
+    start, end = verse_store.surah_starts[surah_id - 1], verse_store.surah_starts[surah_id]
+    return EditionStore.rows(text, columns, start, end)
+
+def surah_rows_upstream(surah_id, editions):
+    """Same rows from per-surah API calls, for when the stores are not loaded:
+    (rows, complete), where `complete` is False if any edition failed."""
+    arabic = surah_edition_texts(surah_id)
+    columns = [surah_edition_texts(surah_id, e) for e in editions]
+    rows = [VerseRow(i + 1, text, [c[i] if i < len(c) else '' for c in columns])
+            for i, text in enumerate(arabic)]
+    return rows, bool(arabic) and all(columns)
 
 @app.route('/quran/<int:surah_id>')
+@cache_for(300, stale_while_revalidate=86400)
 def quran_surah(surah_id):
     if surah_id < 1 or surah_id > 114:
         return render_template('404.html'), 404
 
     surah_meta = SURAHS_META[surah_id - 1]
-    translation = request.args.get('translation', 'en.sahih')
-
-    # Fetch Arabic text from AlQuran Cloud API (Complete Surah)
-    url = f"https://api.alquran.cloud/v1/surah/{surah_id}"
-    data = cached_get(url, ttl=86400) # Cache for 24h
-    verses = []
-    if data and data.get('data') and data['data'].get('ayahs'):
-        verses = [{'text': a['text'], 'number': a['numberInSurah']} for a in data['data']['ayahs']]
-
-    # Fetch translation
-    trans_verses = []
-    if translation:
-        turl = f"https://api.alquran.cloud/v1/surah/{surah_id}/{translation}"
-        tdata = cached_get(turl, ttl=86400)
-        if tdata and tdata.get('data') and tdata['data'].get('ayahs'):
-            trans_verses = [{'text': a['text']} for a in tdata['data']['ayahs']]
+    # `translations=a,b,c` shows editions side by side; `translation=x` just one
+    if 'translations' in request.args:
+        editions = parse_editions(request.args['translations'])
+        edition_query = f"translations={','.join(editions)}"
+    else:
+        translation = request.args.get('translation', 'en.sahih')
+        if translation and translation not in TRANSLATION_MAP:
+            translation = 'en.sahih'
+        editions = [translation] if translation else []
+        edition_query = f"translation={translation}"
+
+    verses, complete = surah_rows(surah_id, editions), True
+    if verses is None:
+        verses, complete = surah_rows_upstream(surah_id, editions)
 
     prev_surah = SURAHS_META[surah_id - 2] if surah_id > 1 else None
     next_surah = SURAHS_META[surah_id] if surah_id < 114 else None
 
-    return render_template('quran/surah.html',
+    html = render_template('quran/surah.html',
         surah=surah_meta,
         verses=verses,
-        trans_verses=trans_verses,
+        columns=[(e, PARALLEL_EDITIONS[e]) for e in editions],
         prev_surah=prev_surah,
         next_surah=next_surah,
         reciters=RECITERS,
         translations=TRANSLATION_MAP,
-        current_translation=translation,
+        parallel_editions=PARALLEL_EDITIONS,
+        tafsirs=TAFSIR_MAP,
+        current_translation=editions[0] if len(editions) == 1 else '',
+        edition_query=edition_query,
         title=f"سورة {surah_meta['name']} — {surah_meta['name_en']}",
         description=f"اقرأ واستمع لسورة {surah_meta['name']} كاملة. {surah_meta['verses']} آية، {surah_meta['type'] == 'meccan' and 'مكية' or 'مدنية'}."
     )
+    if not verses:
+        return html, 503
+    # A page missing an edition is served, but not cached
+    return html if complete else (html, {'Cache-Control': 'no-store'})
+
+@app.route('/api/quran/suggest')
+@cache_for(86400, stale_while_revalidate=86400)
+def api_quran_suggest():
+    """Surah typeahead — ranked fuzzy match on names, meanings and transliterations."""
+    query = request.args.get('q', '')
+    try:
+        limit = max(1, min(20, int(request.args.get('limit', 8))))
+    except ValueError:
+        limit = 8
+    return jsonify([
+        {'id': s['id'], 'name': s['name'], 'name_en': s['name_en'], 'meaning': s['meaning'],
+         'verses': s['verses'], 'score': score}
+        for s, score in get_surah_index().search(query, limit)
+    ])
+
+@app.route('/api/quran/root/<root>')
+@cache_for(86400, stale_while_revalidate=604800)
+def api_quran_root(root):
+    """Every occurrence of a root (Arabic or Buckwalter), paginated."""
+    if not morphology.ensure_loaded():
+        return jsonify({'error': 'Morphology data not installed'}), 503
+    root_id = morphology.root_id(root)
+    if root_id is None:
+        return jsonify({'error': 'Unknown root'}), 404
+    offset = max(0, request.args.get('offset', 0, type=int))
+    limit = max(1, min(1000, request.args.get('limit', 200, type=int)))
+    total, occurrences = morphology.occurrences(root_id, offset, limit)
+    return jsonify({
+        'root': to_arabic(morphology.roots.values[root_id]),
+        'buckwalter': morphology.roots.values[root_id],
+        'count': total,
+        'lemmas': morphology.root_lemmas(root_id),
+        'offset': offset,
+        # [surah, ayah, word] triples
+        'occurrences': occurrences,
+    })
+
+@app.route('/api/quran/word/<int:surah>/<int:ayah>/<int:word>')
+@cache_for(86400, stale_while_revalidate=604800)
+def api_quran_word(surah, ayah, word):
+    """Lemma, root and part of speech of one word."""
+    if not valid_ayah(surah, ayah):
+        return jsonify({'error': 'Invalid surah or ayah'}), 404
+    if not morphology.ensure_loaded():
+        return jsonify({'error': 'Morphology data not installed'}), 503
+    info = morphology.word(surah, ayah, word)
+    if info is None:
+        return jsonify({'error': 'Invalid word'}), 404
+    return jsonify(info)
 
 @app.route('/quran/search')
+@limiter.limit('quran-search', per_minute=20, burst=10)
 def quran_search():
     query = request.args.get('q', '').strip()
     # Basic input sanitization
@@ -559,16 +615,14 @@ def hadith_index():
         description="تصفح كتب الصحاح والسنن الستة في أقوى موسوعة للحديث الشريف."
     )
 
-@app.route('/hadith/<collection>')
-def hadith_collection(collection):
-    """Shows list of sections/books inside a Hadith collection."""
-    col_meta = next((c for c in HADITH_COLLECTIONS if c['id'] == collection), None)
-    if not col_meta:
-        return render_template('404.html'), 404
+def hadith_edition_url(collection):
+    return f"https://cdn.jsdelivr.net/gh/fawazahmed0/hadith-api@1/editions/{collection}.json"
 
-    # Fetch sections metadata
-    url = f"https://cdn.jsdelivr.net/gh/fawazahmed0/hadith-api@1/editions/{collection}.json"
-    data = cached_get(url, ttl=86400)
+_hadith_section_ids = {}  # collection -> frozenset of section ids, kept from the last listing
+
+def get_hadith_sections(collection):
+    """Sections/books of a Hadith collection, sorted, with Arabic names where known."""
+    data = cached_get(hadith_edition_url(collection), ttl=86400)
     
     sections = []
     if data and 'metadata' in data:
@@ -583,6 +637,28 @@ def hadith_collection(collection):
             sections.sort(key=lambda x: int(x['id']))
         except:
             pass  # Fallback if IDs are not ints
+        _hadith_section_ids[collection] = frozenset(s['id'] for s in sections)
+    return sections
+
+def valid_section(collection, section_id):
+    """Whether `section_id` is listed for `collection`. When the listing
+    cannot be fetched the id is only checked for shape, so an upstream
+    outage does not turn valid links into 404s."""
+    if not section_id.isdigit() or len(section_id) > 4:
+        return False
+    if collection not in _hadith_section_ids:
+        get_hadith_sections(collection)
+    known = _hadith_section_ids.get(collection)
+    return not known or section_id in known
+
+@app.route('/hadith/<collection>')
+def hadith_collection(collection):
+    """Shows list of sections/books inside a Hadith collection."""
+    col_meta = next((c for c in HADITH_COLLECTIONS if c['id'] == collection), None)
+    if not col_meta:
+        return render_template('404.html'), 404
+
+    sections = get_hadith_sections(collection)
 
     return render_template('hadith/sections.html',
         collection=col_meta,
@@ -592,10 +668,11 @@ def hadith_collection(collection):
     )
 
 @app.route('/hadith/<collection>/<section_id>')
+@cache_for(300, stale_while_revalidate=86400)
 def hadith_section_read(collection, section_id):
     """Reads specific section (Book) of Hadith."""
     col_meta = next((c for c in HADITH_COLLECTIONS if c['id'] == collection), None)
-    if not col_meta:
+    if not col_meta or not valid_section(collection, section_id):
         return render_template('404.html'), 404
 
     url = f"https://cdn.jsdelivr.net/gh/fawazahmed0/hadith-api@1/editions/{collection}/{section_id}.json"
@@ -604,7 +681,7 @@ def hadith_section_read(collection, section_id):
     hadiths = data.get('hadiths', []) if data else []
     section_name = data.get('metadata', {}).get('section', {}).get(str(section_id), f"القسم {section_id}") if data else ""
 
-    return render_template('hadith/reader.html',
+    html = render_template('hadith/reader.html',
         collection=col_meta,
         hadiths=hadiths,
         section_id=section_id,
@@ -612,6 +689,8 @@ def hadith_section_read(collection, section_id):
         title=f"{section_name} — {col_meta['name']}",
         description=f"قراءة {section_name} من {col_meta['name']}."
     )
+    # Upstream failed: an empty page must not be cached
+    return html if data else (html, 503)
 
 @app.route('/hadith/search')
 def hadith_search():
@@ -641,6 +720,8 @@ def hadith_search():
                         h['collection'] = {'name': 'الأربعين النووية', 'id': 'ara-nawawi'}
                         results.append(h)
                         if len(results) >= 20: break
+        except UpstreamBusy:
+            raise
         except Exception as e:
             logger.warning(f"Hadith search error: {e}")
 
@@ -699,6 +780,7 @@ def names():
 @app.route('/calendar')
 def calendar():
     hijri_date = None
+    Gregorian = get_gregorian()
     if Gregorian:
         try:
             today = date.today()
@@ -723,6 +805,7 @@ def calendar():
 # ═══════════════════════════════════════════════════════════════
 
 @app.route('/api/prayer-times')
+@cache_for(1800, stale_while_revalidate=600)
 def api_prayer_times():
     lat = request.args.get('lat')
     lng = request.args.get('lng')
@@ -747,41 +830,154 @@ def api_prayer_times():
         })
     return jsonify({'error': 'Provider error'}), 503
 
+def tafsir_texts(edition, surah):
+    """Every ayah's tafsir for `surah`: from the local column when there is
+    one, otherwise a single per-surah fetch shared by all its ayat."""
+    column = edition_column(edition)
+    if column is not None:
+        start = verse_store.surah_starts[surah - 1]
+        return list(column.between(start, verse_store.surah_starts[surah]))
+    return surah_edition_texts(surah, edition)
+
+def tafsir_source(edition):
+    return TAFSIR_MAP[edition].split(' — ', 1)[-1]
+
+@app.route('/api/tafsir/<int:surah>')
+@cache_for(86400, stale_while_revalidate=604800)
+@limiter.limit('tafsir-surah', per_minute=30, burst=10)
+def api_tafsir_surah(surah):
+    """Tafsir for a whole surah, or `from`..`to`, in one compact payload."""
+    edition = request.args.get('edition', DEFAULT_TAFSIR)
+    if edition not in TAFSIR_MAP or not 1 <= surah <= 114:
+        return jsonify({'error': 'Unknown surah or tafsir edition'}), 404
+    first = request.args.get('from', 1, type=int)
+    last = request.args.get('to', SURAHS_META[surah - 1]['verses'], type=int)
+    if not (valid_ayah(surah, first) and valid_ayah(surah, last) and first <= last):
+        return jsonify({'error': 'Invalid ayah range'}), 400
+
+    texts = tafsir_texts(edition, surah)
+    if len(texts) < last:
+        return jsonify({'error': 'Tafsir unavailable'}), 503
+    return jsonify({
+        'edition': edition,
+        'source': tafsir_source(edition),
+        'surah': surah,
+        'from': first,
+        'texts': texts[first - 1:last],
+    })
+
 @app.route('/api/tafsir/<int:surah>/<int:ayah>')
+@cache_for(86400, stale_while_revalidate=604800)
+@limiter.limit('tafsir', per_minute=60, burst=30)
 def api_tafsir(surah, ayah):
-    """Get Tafsir (Ibn Kathir or Saadi) for a specific verse."""
-    # Using AlQuran Cloud with tafsir edition or similar (or mock for MVP if complex)
-    # Using `tafsir.api` is better but for now let's use AlQuran Cloud 'ar.muyassar' as simplified tafsir
-    url = f"https://api.alquran.cloud/v1/ayah/{surah}:{ayah}/ar.muyassar"
-    data = cached_get(url, ttl=86400*7)
-    if data and 'data' in data:
-        return jsonify({'text': data['data']['text'], 'source': 'تفسير الميسر'})
-    return jsonify({'text': 'تفسير غير متاح حالياً.', 'source': ''})
+    """Get Tafsir (Muyassar, Ibn Kathir or Saadi) for a specific verse."""
+    edition = request.args.get('edition', DEFAULT_TAFSIR)
+    if not valid_ayah(surah, ayah) or edition not in TAFSIR_MAP:
+        return jsonify({'error': 'Invalid surah, ayah or edition'}), 404
+    texts = tafsir_texts(edition, surah)
+    if len(texts) >= ayah and texts[ayah - 1]:
+        return jsonify({'text': texts[ayah - 1], 'source': tafsir_source(edition)})
+    return jsonify({'text': 'تفسير غير متاح حالياً.', 'source': ''}), 503
+
+# DAILY CONTENT — ayah/hadith/dhikr of the day from a precomputed year table (see daily.py)
+daily_content = DailyContent()
+
+def build_daily(year):
+    """Materialize `year`'s daily table, loading the stores (and fetching
+    their corpora) as needed. Without the Quran text the hadith and dhikr
+    columns are still filled and the table is marked incomplete.
+    Run offline by `python daily.py` or in a background thread."""
+    from daily import materialize
+    store = verse_store if verse_store.ensure_loaded(fetch_json, busy=UpstreamBusy) else None
+    translation = edition_store.get('en.sahih', fetch_json, busy=UpstreamBusy) if store else None
+    data = cached_get(hadith_edition_url('ara-nawawi'), ttl=86400 * 7)
+    hadiths = [{'number': h.get('hadithnumber'), 'text': h.get('text', '')}
+               for h in (data or {}).get('hadiths', []) if h.get('text')]
+    return materialize(year, store, translation, hadiths, load_json('adhkar.json'))
+
+def install_daily(year):
+    table = build_daily(year)
+    if table:
+        daily_content.install(table)
+
+def daily_day():
+    """(date, entry or None) for `?date=YYYY-MM-DD` or today; raises ValueError on a bad date.
+    A missing table is built in the background; until then the entry is None."""
+    value = request.args.get('date')
+    day = date.fromisoformat(value) if value else date.today()
+    if abs(day.year - date.today().year) > 1:
+        raise ValueError(value)  # only this year's neighbours are ever built
+    entry = daily_content.day(day)
+    if daily_content.needs_build(day.year):
+        load_in_background(f"daily-{day.year}", functools.partial(install_daily, day.year))
+    return day, entry
+
+def daily_response(payload, day, final=False):
+    """`final`: built from a complete table read from data/daily."""
+    response = jsonify(payload)
+    if final and request.args.get('date'):
+        # A dated URL never changes
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        response.headers['Cache-Control'] = f"public, max-age={seconds_until_midnight() if day == date.today() else 3600}"
+    return response
 
 @app.route('/api/vod')
 def api_vod():
-    """Returns Verse of the Day (JSON) — deterministic per day without polluting global random."""
-    surah_idx = get_today_verse_index(len(SURAHS_META))
-    s = SURAHS_META[surah_idx]
-    ayah_idx = get_today_verse_index(s['verses'])
-    a = ayah_idx + 1  # 1-based
-    
-    # Get Text
-    url = f"https://api.alquran.cloud/v1/ayah/{s['id']}:{a}"
-    data = cached_get(url)
-    text = ''
-    if data and data.get('data'):
-        text = data['data'].get('text', '')
-    
-    return jsonify({
+    """Returns Verse of the Day (JSON) — a uniform, non-repeating pick per day of the year."""
+    try:
+        day, entry = daily_day()
+    except ValueError:
+        return jsonify({'error': 'Invalid date'}), 400
+    if entry and entry['ayah']:
+        ayah = entry['ayah']
+        s, a, text, translation = SURAHS_META[ayah['surah'] - 1], ayah['ayah'], ayah['text'], ayah['translation']
+    else:
+        # No table (or one built without the text) yet: same schedule, text fetched per day
+        ayah_index = daily_schedule(day.year)[day.timetuple().tm_yday - 1][0]
+        surah_id, a = verse_store.locate(ayah_index)
+        s, translation = SURAHS_META[surah_id - 1], None
+        data = cached_get(f"https://api.alquran.cloud/v1/ayah/{surah_id}:{a}", ttl=86400)
+        text = data['data'].get('text', '') if data and data.get('data') else ''
+        if not text:
+            return jsonify({'error': 'Not available'}), 503
+
+    return daily_response({
+        'date': day.isoformat(),
         'surah': s['name'],
         'surah_en': s['name_en'],
         'ayah': a,
         'text': text,
+        'translation': translation,
         'link': f"/quran/{s['id']}?play={a}"
-    })
+    }, day, final=bool(entry) and daily_content.saved(day.year))
+
+@app.route('/api/hadith-of-the-day')
+def api_hadith_of_the_day():
+    try:
+        day, entry = daily_day()
+    except ValueError:
+        return jsonify({'error': 'Invalid date'}), 400
+    if not entry or not entry['hadith']:
+        return jsonify({'error': 'Not available'}), 503
+    return daily_response({
+        'date': day.isoformat(),
+        'collection': 'الأربعين النووية',
+        **entry['hadith'],
+    }, day, final=daily_content.saved(day.year))
+
+@app.route('/api/dhikr-of-the-day')
+def api_dhikr_of_the_day():
+    try:
+        day, entry = daily_day()
+    except ValueError:
+        return jsonify({'error': 'Invalid date'}), 400
+    if not entry or not entry['dhikr']:
+        return jsonify({'error': 'Not available'}), 503
+    return daily_response({'date': day.isoformat(), **entry['dhikr']}, day, final=daily_content.saved(day.year))
 
 @app.route('/api/qibla')
+@cache_for(2592000)
 def api_qibla():
     """Calculate Qibla direction and distance from given coordinates."""
     try:
@@ -819,15 +1015,15 @@ def api_qibla():
     })
 
 @app.route('/api/ip-geo')
+@cache_for(3600, private=True)
+@limiter.limit('ip-geo', per_minute=10, burst=5)
 def api_ip_geo():
     """Server-side IP Geolocation proxy to avoid adblockers."""
     try:
-        # Get client IP
-        if request.headers.getlist("X-Forwarded-For"):
-            ip = request.headers.getlist("X-Forwarded-For")[0]
-        else:
-            ip = request.remote_addr
-            
+        # Client IP, already resolved from X-Forwarded-For by ProxyFix for
+        # TRUSTED_PROXIES hops; the raw header is client-controlled
+        ip = request.remote_addr
+
         # Use ipwho.is (free, no auth)
         url = f"http://ipwho.is/{ip}" if ip != '127.0.0.1' else "http://ipwho.is/"
         data = cached_get(url, ttl=3600)
@@ -839,10 +1035,13 @@ def api_ip_geo():
                 'longitude': data['longitude']
             })
         return jsonify({'success': False, 'error': 'Provider failed'}), 503
+    except UpstreamBusy:
+        raise
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/convert-date')
+@cache_for(2592000)
 def api_convert_date():
     """Convert Gregorian date to Hijri with optional regional adjustment."""
     date_str = request.args.get('date')
@@ -858,6 +1057,7 @@ def api_convert_date():
 
     try:
         y, m, d = map(int, date_str.split('-'))
+        Gregorian = get_gregorian()
         if Gregorian:
             # Apply adjustment to the Gregorian date before conversion
             from datetime import date as date_cls, timedelta
@@ -872,10 +1072,14 @@ def api_convert_date():
         return jsonify({'error': 'Invalid date format'}), 400
 
 @app.route('/api/audio-url')
+@cache_for(86400, stale_while_revalidate=604800)
+@limiter.limit('audio', per_minute=60, burst=30)
 def api_audio_url():
-    surah = request.args.get('surah')
-    ayah = request.args.get('ayah')
+    surah = request.args.get('surah', type=int)
+    ayah = request.args.get('ayah', type=int)
     reciter = request.args.get('reciter', 'ar.alafasy')
+    if not valid_ayah(surah, ayah) or reciter not in RECITER_IDS:
+        return jsonify({'error': 'Invalid surah, ayah or reciter'}), 400
     url = f"https://api.alquran.cloud/v1/ayah/{surah}:{ayah}/{reciter}"
     data = cached_get(url, ttl=86400)
     if data and data.get('data'):
@@ -890,50 +1094,247 @@ def api_audio_url():
 #  SEO & SITEMAP
 # ═══════════════════════════════════════════════════════════════
 
-@app.route('/sitemap.xml')
-def sitemap():
-    base = request.host_url.rstrip('/')
-    urls = []
-    
-    # Static priority pages
-    urls.append({'loc': f"{base}/", 'p': '1.0'})
-    urls.append({'loc': f"{base}/quran", 'p': '0.9'})
-    urls.append({'loc': f"{base}/hadith", 'p': '0.8'})
-    urls.append({'loc': f"{base}/prayer-times", 'p': '0.8'})
-    urls.append({'loc': f"{base}/adhkar", 'p': '0.7'})
-    urls.append({'loc': f"{base}/names", 'p': '0.7'})
-    urls.append({'loc': f"{base}/qibla", 'p': '0.6'})
-    urls.append({'loc': f"{base}/calendar", 'p': '0.6'})
-    
-    # Dynamic Surah pages
-    for s in SURAHS_META:
-        urls.append({'loc': f"{base}/quran/{s['id']}", 'p': '0.7'})
+sitemap_cache = SitemapCache()
+SITEMAP_TTL = 86400
+
+def _data_mtime(*parts):
+    """lastmod of a page built from a data/ file; None (no lastmod) if it is missing."""
+    try:
+        return os.path.getmtime(os.path.join(os.path.dirname(__file__), 'data', *parts))
+    except OSError:
+        return None
+
+def site_base():
+    """Canonical base URL: SITE_URL, or the request's own host when unset (development)."""
+    return app.config['SITE_URL'] or request.host_url.rstrip('/')
+
+def sitemap_shards(base):
+    """Shard name -> callable returning its (loc, lastmod, changefreq, priority) entries."""
+    def pages():
+        # Only pages rendered from a data/ file have a real modification date
+        return [
+            (f"{base}/", None, 'daily', '1.0'),
+            (f"{base}/quran", None, 'weekly', '0.9'),
+            (f"{base}/hadith", None, 'weekly', '0.8'),
+            (f"{base}/prayer-times", None, 'weekly', '0.8'),
+            (f"{base}/adhkar", _data_mtime('adhkar.json'), 'monthly', '0.7'),
+            (f"{base}/names", _data_mtime('names.json'), 'monthly', '0.7'),
+            (f"{base}/qibla", None, 'monthly', '0.6'),
+            (f"{base}/calendar", None, 'weekly', '0.6'),
+        ]
 
-    # Hadith collection pages
+    def quran():
+        lastmod = _data_mtime('quran', 'index.json')
+        entries = [(f"{base}/quran/{s['id']}", lastmod, 'monthly', '0.7') for s in SURAHS_META]
+        entries += [(f"{base}/quran/juz/{n}", lastmod, 'monthly', '0.6') for n in range(1, DIVISIONS['juz'] + 1)]
+        entries += [(f"{base}/quran/hizb/{n}", lastmod, 'monthly', '0.5') for n in range(1, DIVISIONS['hizb'] + 1)]
+        entries += [(f"{base}/quran/page/{n}", lastmod, 'monthly', '0.5') for n in range(1, DIVISIONS['page'] + 1)]
+        return entries
+
+    def translations():
+        return [(f"{base}/quran/{s['id']}?translation={t}", None, 'monthly', '0.4')
+                for t in TRANSLATION_MAP for s in SURAHS_META]
+
+    def hadith(collection):
+        # The hadith API publishes no modification dates, so no lastmod
+        entries = [(f"{base}/hadith/{collection}", None, 'monthly', '0.6')]
+        entries += [(f"{base}/hadith/{collection}/{sec['id']}", None, 'monthly', '0.5')
+                    for sec in get_hadith_sections(collection)]
+        return entries
+
+    shards = {'pages': pages, 'quran': quran, 'translations': translations}
     for c in HADITH_COLLECTIONS:
-        urls.append({'loc': f"{base}/hadith/{c['id']}", 'p': '0.6'})
-        
-    xml = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    for u in urls:
-        xml += f"  <url><loc>{u['loc']}</loc><priority>{u['p']}</priority><changefreq>weekly</changefreq></url>\n"
-    xml += '</urlset>'
-    
-    response = make_response(xml)
+        shards[f"hadith-{c['id']}"] = functools.partial(hadith, c['id'])
+    return shards
+
+def sitemap_response(doc):
+    _, ttl, body, gzipped = doc
+    if 'gzip' in request.headers.get('Accept-Encoding', '').lower():
+        response = make_response(gzipped)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = make_response(body)
     response.headers["Content-Type"] = "application/xml"
+    response.headers['Cache-Control'] = f"public, max-age={min(ttl, 3600)}"
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+@app.route('/sitemap.xml')
+def sitemap():
+    """Sitemap index pointing at the per-section shards."""
+    base = site_base()
+
+    def build():
+        entries = []
+        for name, shard in sitemap_shards(base).items():
+            if name.startswith('hadith-'):
+                # Listed without fetching; one collection never nears the URL limit
+                entries.append((f"{base}/sitemaps/{name}.xml", None))
+                continue
+            urls = shard()
+            lastmod = max((u[1] for u in urls if u[1]), default=None)
+            for page in range(1, page_count(len(urls)) + 1):
+                suffix = '' if page == 1 else f"/{page}"
+                entries.append((f"{base}/sitemaps/{name}{suffix}.xml", lastmod))
+        return render_index(entries), SITEMAP_TTL
+
+    return sitemap_response(sitemap_cache.get((base, 'index', 1), build))
+
+@app.route('/sitemaps/<name>.xml', defaults={'page': 1})
+@app.route('/sitemaps/<name>/<int:page>.xml')
+def sitemap_shard(name, page):
+    base = site_base()
+    shard = sitemap_shards(base).get(name)
+    if not shard:
+        return render_template('404.html'), 404
+    # Hadith shards are a single page; the others are counted without fetching
+    if page > 1 and (name.startswith('hadith-') or page > page_count(len(shard()))):
+        return render_template('404.html'), 404
+
+    def build():
+        entries = paginate(shard(), page)
+        if entries is None:
+            return None
+        # An empty hadith shard means the upstream failed; retry soon
+        ttl = 600 if name.startswith('hadith-') and len(entries) <= 1 else SITEMAP_TTL
+        return render_urlset(entries), ttl
+
+    doc = sitemap_cache.get((base, name, page), build)
+    if doc is None:
+        return render_template('404.html'), 404
+    return sitemap_response(doc)
+
+# ═══════════════════════════════════════════════════════════════
+#  PWA — SERVICE WORKER & OFFLINE BUNDLE
+# ═══════════════════════════════════════════════════════════════
+
+OFFLINE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'offline')
+
+@functools.lru_cache(maxsize=4)
+def render_service_worker(version):
+    """static/sw.js with the asset version and fingerprinted URLs filled in."""
+    with open(os.path.join(app.static_folder, 'sw.js'), encoding='utf-8') as f:
+        source = f.read()
+    urls = {name: static_versions.url(name) for name in static_versions.hashes
+            if name.endswith(('.css', '.js')) and name != 'sw.js'}
+    return (source
+            .replace("const ASSET_VERSION = 'dev';", f"const ASSET_VERSION = '{version}';", 1)
+            .replace("const ASSET_URLS = {};", f"const ASSET_URLS = {json.dumps(urls)};", 1))
+
+@app.route('/sw.js')
+def service_worker():
+    """Served from the root so the worker's scope covers the whole site."""
+    response = make_response(render_service_worker(static_versions.version))
+    response.mimetype = 'application/javascript'
+    response.headers['Cache-Control'] = 'no-cache'
+    response.set_etag(static_versions.version)
+    return response.make_conditional(request)
+
+@app.route('/offline/<path:filename>')
+def offline_bundle(filename):
+    """Content-hashed chunks built by offline_bundle.py, plus their manifest."""
+    if filename == 'manifest.json':
+        response = send_from_directory(OFFLINE_DIR, filename, mimetype='application/json', max_age=0)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    if not filename.endswith('.json.gz'):
+        return render_template('404.html'), 404
+
+    if 'gzip' in request.headers.get('Accept-Encoding', '').lower():
+        response = send_from_directory(OFFLINE_DIR, filename, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        path = os.path.join(OFFLINE_DIR, os.path.basename(filename))
+        if not os.path.exists(path):
+            return render_template('404.html'), 404
+        with open(path, 'rb') as f:
+            response = make_response(gzip.decompress(f.read()))
+        response.headers['Content-Type'] = 'application/json'
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response.headers['Vary'] = 'Accept-Encoding'
     return response
 
 @app.route('/robots.txt')
 def robots():
-    base = request.host_url.rstrip('/')
+    base = site_base()
     txt = f"User-agent: *\nAllow: /\nSitemap: {base}/sitemap.xml"
     response = make_response(txt)
     response.headers["Content-Type"] = "text/plain"
     return response
 
+# ═══════════════════════════════════════════════════════════════
+#  WARM-UP & HEALTH
+# ═══════════════════════════════════════════════════════════════
+
+# Ready from the start: every view has a fallback for data that is not
+# warm yet, and every entry point runs preload() before serving.
+_warm = {'done': False, 'ms': None}
+
+def preload(fetch=False):
+    """Load data sets up front. Under gunicorn's preload_app this runs once
+    in the master, so workers share the tables copy-on-write.
+
+    With `fetch` (wsgi.py with PRELOAD_FETCH), what data/ lacks is
+    downloaded too: the Quran text, the PRELOAD_EDITIONS columns and this
+    year's daily table. The HTTP session used for that is closed afterwards,
+    so no socket is inherited by the forked workers."""
+    t0 = datetime.now()
+    verse_store.ensure_loaded(fetch_json if fetch else None)
+    fetched = {e.strip() for e in app.config['PRELOAD_EDITIONS'].split(',')} if fetch else ()
+    for edition in PARALLEL_EDITIONS:
+        # Local file, else one corpus fetch for the preloaded editions
+        edition_store.get(edition, fetch_json if edition in fetched and edition not in TAFSIR_SOURCES else None)
+    get_surah_index()
+    morphology.ensure_loaded()
+    year = date.today().year
+    if daily_content.table(year) is None and fetch:
+        install_daily(year)
+    for name in ('adhkar.json', 'names.json'):
+        load_json(name)
+    get_gregorian()
+    if fetch:
+        close_session()
+    _warm.update(done=True, ms=round((datetime.now() - t0).total_seconds() * 1000, 1))
+    logger.info(f"Preloaded data in {_warm['ms']} ms")
+
+def warm_state():
+    return {
+        'preloaded': _warm['done'],
+        'preload_ms': _warm['ms'],
+        'quran_text': verse_store.loaded,
+        'editions': sorted(edition_store.columns),
+        'surah_index': get_surah_index.cache_info().currsize > 0,
+        'morphology': morphology.loaded,
+        'daily_table': daily_content.loaded(date.today().year),
+        'http_cache_entries': len(_cache),
+        'negative_cache_entries': len(_negative_cache),
+        'asset_version': static_versions.version,
+        'pid': os.getpid(),
+    }
+
+@app.route('/healthz')
+def healthz():
+    """Liveness: the process answers."""
+    response = jsonify({'status': 'ok'})
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@app.route('/readyz')
+def readyz():
+    """Readiness, with what is warm in this worker."""
+    response = jsonify({'status': 'ready', **warm_state()})
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
 @app.errorhandler(404)
 def page_not_found(e):
     return render_template('404.html'), 404
 
+@app.errorhandler(UpstreamBusy)
+def upstream_busy(e):
+    logger.warning(f"Upstream busy, rejecting {request.path}")
+    return too_many_requests(e.retry_after)
+
 @app.errorhandler(500)
 def internal_error(e):
     logger.error(f"Internal Server Error: {e}")
@@ -942,5 +1343,8 @@ def internal_error(e):
 
 
 if __name__ == '__main__':
-    logger.info("🕌 Starting Islamic VIP Website on http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
+    # Development server; production runs `python serve.py` (gunicorn)
+    port = int(os.environ.get('PORT', 5000))
+    logger.info(f"🕌 Starting Islamic VIP Website on http://localhost:{port}")
+    preload()
+    app.run(debug=app.config['DEBUG'], host=os.environ.get('HOST', '0.0.0.0'), port=port, threaded=True)
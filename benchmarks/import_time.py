@@ -0,0 +1,76 @@
+"""
+Cold-start budget: how long `import app` takes in a fresh interpreter.
+
+Each run spawns a new Python process with -X importtime, so module caches
+never carry over. Exits non-zero when the median exceeds the budget, which
+makes it usable as a CI gate:
+
+    python benchmarks/import_time.py --budget-ms 250
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', 250))
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def measure_once(module='app'):
+    """One fresh-process import; returns (total_ms, {module: (self_ms, cumulative_ms)})."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"`import {module}` failed:\n{proc.stderr[-2000:]}")
+    modules = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            modules[m.group(4)] = (int(m.group(1)) / 1000, int(m.group(2)) / 1000)
+    return modules.get(module, (0, 0))[1], modules
+
+
+def measure(module='app', runs=5, top=10):
+    # Byte-compile first so every run measures the warm-.pyc case
+    subprocess.run([sys.executable, '-m', 'compileall', '-q', '-x', r'benchmarks|\.venv', ROOT],
+                   capture_output=True)
+    totals, last = [], {}
+    for _ in range(runs):
+        total, last = measure_once(module)
+        totals.append(total)
+    slowest = sorted(last.items(), key=lambda kv: kv[1][0], reverse=True)[:top]
+    return {
+        'module': module,
+        'runs': runs,
+        'median_ms': round(statistics.median(totals), 2),
+        'min_ms': round(min(totals), 2),
+        'slowest_self_ms': {name: round(self_ms, 2) for name, (self_ms, _) in slowest},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    result = measure(args.module, args.runs)
+    print(f"import {result['module']}: median {result['median_ms']} ms, min {result['min_ms']} ms "
+          f"({result['runs']} runs, budget {args.budget_ms} ms)")
+    print("Slowest modules (self time):")
+    for name, ms in result['slowest_self_ms'].items():
+        print(f"  {name:40} {ms:>8.2f} ms")
+    if result['median_ms'] > args.budget_ms:
+        print("❌ Over budget")
+        sys.exit(1)
+    print("✅ Within budget")
+
+
+if __name__ == '__main__':
+    main()
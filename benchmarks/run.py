@@ -0,0 +1,307 @@
+"""
+Micro-benchmarks and a concurrent load scenario for the hot routes.
+
+Upstream APIs are replaced by benchmarks/stub_upstream.py, so results only
+measure this app. Results are written as JSON; pass --compare to diff a run
+against an earlier one (e.g. from the previous commit).
+
+    python benchmarks/run.py
+    python benchmarks/run.py --quick --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as app_module  # noqa: E402
+import import_time  # noqa: E402
+import stub_upstream  # noqa: E402
+from flask import make_response  # noqa: E402
+from morphology import Morphology  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+# Route mix for the load scenario: (weight, path)
+LOAD_MIX = [
+    (30, '/quran/2'),
+    (15, '/quran/36?translation=en.sahih'),
+    (10, '/quran/juz/30'),
+    (5, '/quran/page/300'),
+    (10, '/quran'),
+    (10, '/api/qibla?lat=51.5&lng=-0.12'),
+    (5, '/api/tafsir/2/255'),
+    (5, '/api/audio-url?surah=1&ayah=1&reciter=ar.alafasy'),
+    (5, '/hadith/ara-bukhari/1'),
+    (5, '/sitemap.xml'),
+]
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def bench(fn, number, repeat):
+    """timeit-style: best/median of `repeat` rounds of `number` calls, in µs per call."""
+    fn()  # warm-up
+    rounds = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - t0) / number * 1e6)
+    return {
+        'best_us': round(min(rounds), 2),
+        'median_us': round(statistics.median(rounds), 2),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def micro_benchmarks(quick):
+    app = app_module.app
+    client = app.test_client()
+    n = 20 if quick else 200
+    r = 3 if quick else 7
+    results = {}
+
+    url = 'https://api.alquran.cloud/v1/surah/2'
+    app_module.cached_get(url)
+    results['cached_get_hit'] = bench(lambda: app_module.cached_get(url), n * 50, r)
+
+    def miss():
+        app_module._cache.clear()
+        app_module.cached_get(url)
+    results['cached_get_miss'] = bench(miss, max(5, n // 10), r)
+
+    index = app_module.get_surah_index()
+    results['surah_index_search'] = bench(lambda: index._search('al baqara', 8), n * 10, r)
+
+    body = client.get('/quran/2').get_data()
+    with app.test_request_context('/quran/2', headers={'Accept-Encoding': 'gzip'}):
+        results['compress_response'] = bench(
+            lambda: app_module.compress_response(make_response(body)), n, r)
+
+    routes = {
+        'quran_surah': '/quran/2',
+        'quran_surah_translation': '/quran/2?translation=en.sahih',
+        'quran_surah_parallel': '/quran/2?translations=en.sahih,fr.hamidullah,ar.muyassar',
+        'quran_juz': '/quran/juz/1',
+        'quran_page': '/quran/page/300',
+        'api_qibla': '/api/qibla?lat=51.5&lng=-0.12',
+        'api_quran_suggest': '/api/quran/suggest?q=al%20baqara',
+        'api_tafsir_surah': '/api/tafsir/2',
+        'api_vod': '/api/vod',
+        'sitemap': '/sitemap.xml',
+        'sitemap_shard_quran': '/sitemaps/quran.xml',
+    }
+    for name, path in routes.items():
+        status = client.get(path).status_code
+        if status != 200:
+            print(f"[WARN] {path} returned {status}")
+        results[name] = bench(lambda p=path: client.get(p), n, r)
+
+    def sitemap_rebuild():
+        app_module.sitemap_cache.clear()
+        client.get('/sitemaps/translations.xml')
+    results['sitemap_rebuild_translations'] = bench(sitemap_rebuild, max(5, n // 10), r)
+    return results
+
+
+def morphology_benchmark(quick):
+    """Word index build time and retained memory over a synthetic full-size corpus."""
+    lines = stub_upstream.morphology_corpus(app_module.SURAHS_META)
+    builds = []
+    for _ in range(1 if quick else 3):
+        m = Morphology(app_module.verse_store.surah_starts)
+        t0 = time.perf_counter()
+        m.build(lines)
+        builds.append((time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    m = Morphology(app_module.verse_store.surah_starts)
+    before = tracemalloc.get_traced_memory()[0]
+    m.build(lines)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n = 200 if quick else 2000
+    root_id = m.word_root[0]
+    return {
+        'words': len(m.forms),
+        'build_ms': round(min(builds), 1),
+        'retained_kib': round((retained - before) / 1024),
+        'peak_kib': round((peak - before) / 1024),
+        'word_lookup': bench(lambda: m.word(2, 255, 5), n * 10, 3),
+        'root_lookup': bench(lambda: m.occurrences(root_id, 0, 200), n, 3),
+    }
+
+
+def load_scenario(concurrency, duration, base_url=None):
+    """Hammer LOAD_MIX from `concurrency` threads for `duration` seconds."""
+    paths = [p for w, p in LOAD_MIX for _ in range(w)]
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        if base_url:
+            import requests
+            s = requests.Session()
+            get = lambda p: s.get(base_url + p, timeout=30)  # noqa: E731
+        else:
+            c = app_module.app.test_client()
+            get = lambda p: c.get(p, headers={'Accept-Encoding': 'gzip'})  # noqa: E731
+        local, failed = [], 0
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            resp = get(rnd.choice(paths))
+            local.append(time.perf_counter() - t0)
+            if resp.status_code >= 400:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    ms = [x * 1000 for x in latencies]
+    return {
+        'target': base_url or 'in-process',
+        'concurrency': concurrency,
+        'duration_s': round(elapsed, 2),
+        'requests': len(ms),
+        'errors': errors[0],
+        'throughput_rps': round(len(ms) / elapsed, 1) if elapsed else 0,
+        'p50_ms': round(percentile(ms, 50), 2),
+        'p95_ms': round(percentile(ms, 95), 2),
+        'p99_ms': round(percentile(ms, 99), 2),
+        'max_ms': round(ms[-1], 2) if ms else 0,
+    }
+
+
+def compare(current, baseline_path, threshold):
+    """Print per-benchmark deltas; returns True if anything regressed past threshold %."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressed = False
+    print(f"\nCompared with {baseline.get('commit')} ({baseline_path}):")
+    for name, cur in current['micro'].items():
+        old = baseline.get('micro', {}).get(name)
+        if not old:
+            continue
+        delta = (cur['best_us'] - old['best_us']) / old['best_us'] * 100 if old['best_us'] else 0
+        flag = ' <-- REGRESSION' if delta > threshold else ''
+        regressed |= bool(flag)
+        print(f"  {name:28} {old['best_us']:>10.1f} -> {cur['best_us']:>10.1f} µs  ({delta:+.1f}%){flag}")
+    old_morph, morph = baseline.get('morphology'), current.get('morphology')
+    if old_morph and morph:
+        for key in ('build_ms', 'retained_kib'):
+            print(f"  morphology.{key:17} {old_morph[key]:>10} -> {morph[key]:>10}")
+    if baseline.get('import') and current.get('import'):
+        print(f"  {'import app (ms)':28} {baseline['import']['median_ms']:>10} -> {current['import']['median_ms']:>10}")
+    old_load = baseline.get('load')
+    if old_load and current.get('load'):
+        for key in ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms'):
+            print(f"  load.{key:23} {old_load[key]:>10} -> {current['load'][key]:>10}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='fewer iterations, for a fast sanity run')
+    parser.add_argument('--latency-ms', type=float, default=0, help='simulated upstream latency')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10, help='load scenario length in seconds')
+    parser.add_argument('--no-load', action='store_true', help='skip the load scenario')
+    parser.add_argument('--base-url', help='run the load scenario against a live server instead')
+    parser.add_argument('--out', help='result file (default: benchmarks/results/<time>-<commit>.json)')
+    parser.add_argument('--compare', help='earlier result file to diff against')
+    parser.add_argument('--threshold', type=float, default=10, help='regression threshold in percent')
+    args = parser.parse_args()
+
+    app_module.logger.setLevel(logging.WARNING)
+    app_module.app.logger.setLevel(logging.WARNING)
+    # The load scenario comes from one client address; measure the app, not the limiter
+    app_module.app.config['RATELIMIT_ENABLED'] = False
+    stub_upstream.install(app_module.get_session(), app_module.SURAHS_META, latency_ms=args.latency_ms)
+
+    commit = git_commit()
+    result = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'import': None,
+        'micro': {},
+        'morphology': None,
+        'load': None,
+    }
+
+    print(f"Benchmarking {commit} (Python {result['python']})")
+    result['import'] = import_time.measure(runs=3 if args.quick else 5)
+    print(f"  {'import app':28} median {result['import']['median_ms']:>8.1f} ms")
+    result['micro'] = micro_benchmarks(args.quick)
+    for name, r in result['micro'].items():
+        print(f"  {name:28} best {r['best_us']:>10.1f} µs   median {r['median_us']:>10.1f} µs")
+    result['morphology'] = m = morphology_benchmark(args.quick)
+    print(f"  {'morphology build':28} {m['build_ms']:>8.1f} ms, {m['words']} words, "
+          f"retained {m['retained_kib']} KiB, peak {m['peak_kib']} KiB")
+    print(f"  {'morphology word/root':28} best {m['word_lookup']['best_us']:>6.2f} / {m['root_lookup']['best_us']:.1f} µs")
+
+    if not args.no_load:
+        duration = min(args.duration, 3) if args.quick else args.duration
+        result['load'] = load_scenario(args.concurrency, duration, args.base_url)
+        l = result['load']
+        print(f"\nLoad ({l['target']}, {l['concurrency']} threads, {l['duration_s']}s): "
+              f"{l['throughput_rps']} req/s, p50 {l['p50_ms']} ms, p95 {l['p95_ms']} ms, "
+              f"p99 {l['p99_ms']} ms, errors {l['errors']}/{l['requests']}")
+
+    out = args.out
+    if not out:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{commit}.json")
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\nSaved {out}")
+
+    if args.compare and compare(result, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
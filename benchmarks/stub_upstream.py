@@ -0,0 +1,187 @@
+"""
+Local stub for the upstream APIs (alquran.cloud, jsdelivr hadith-api,
+aladhan, ipwho.is) so benchmarks run offline and deterministically, plus
+a synthetic morphology corpus for the word index.
+
+Mount it on the app's requests session:
+
+    install(app_module.get_session(), app_module.SURAHS_META, latency_ms=0)
+"""
+
+import json
+import random
+import re
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+from quran_store import JUZ_STARTS
+
+_WORDS = ['بِسْمِ', 'اللَّهِ', 'الرَّحْمَٰنِ', 'الرَّحِيمِ', 'الْحَمْدُ', 'لِلَّهِ', 'رَبِّ', 'الْعَالَمِينَ']
+_WORDS_EN = ['In', 'the', 'name', 'of', 'Allah', 'the', 'Most', 'Merciful']
+
+
+class StubUpstream:
+    """Generates upstream-shaped JSON from the surah metadata."""
+
+    def __init__(self, surahs_meta):
+        self.surahs = surahs_meta
+        self.ayahs = []  # (global_number, surah, ayah)
+        for s in surahs_meta:
+            for a in range(1, s['verses'] + 1):
+                self.ayahs.append((len(self.ayahs) + 1, s['id'], a))
+        starts = [self._global(s, a) for s, a in JUZ_STARTS] + [len(self.ayahs) + 1]
+        self.juz_ranges = [(starts[i], starts[i + 1]) for i in range(30)]
+        self.routes = [
+            (r'^/v1/surah/(\d+)(?:/([\w.-]+))?$', self.surah),
+            (r'^/v1/juz/(\d+)/([\w.-]+)$', self.juz),
+            (r'^/v1/(page|hizbQuarter)/(\d+)/([\w.-]+)$', self.division),
+            (r'^/v1/ayah/(\d+):(\d+)(?:/([\w.-]+))?$', self.ayah),
+            (r'^/v1/quran/([\w.-]+)$', self.quran),
+            (r'^/v1/search/([^/]+)/all/(\w+)$', self.search),
+            (r'^/v1/timings$', self.timings),
+            (r'^/gh/fawazahmed0/hadith-api@1/editions/([\w-]+)\.json$', self.hadith_edition),
+            (r'^/gh/fawazahmed0/hadith-api@1/editions/([\w-]+)/(\d+)\.json$', self.hadith_section),
+            (r'^/[\d.:a-fA-F]*$', self.ip_geo),
+        ]
+
+    def _global(self, surah, ayah):
+        return sum(s['verses'] for s in self.surahs[:surah - 1]) + ayah
+
+    @staticmethod
+    def _text(n, edition=None):
+        words = _WORDS_EN if edition and not edition.startswith(('ar', 'quran')) else _WORDS
+        return ' '.join(words[(n + i) % len(words)] for i in range(8 + n % 17))
+
+    def _ayah_obj(self, number, edition=None):
+        _, s, a = self.ayahs[number - 1]
+        meta = self.surahs[s - 1]
+        juz = next(i for i, (lo, hi) in enumerate(self.juz_ranges, 1) if lo <= number < hi)
+        return {
+            'number': number,
+            'text': self._text(number, edition),
+            'numberInSurah': a,
+            'juz': juz,
+            'page': 1 + (number - 1) * 604 // len(self.ayahs),
+            'hizbQuarter': 1 + (number - 1) * 240 // len(self.ayahs),
+            'surah': {'number': s, 'name': meta['name'], 'englishName': meta['name_en']},
+            'audio': f"https://cdn.islamic.network/quran/audio/128/{edition or 'ar.alafasy'}/{number}.mp3",
+        }
+
+    def surah(self, n, edition=None):
+        n = int(n)
+        if not 1 <= n <= 114:
+            return 404, {'code': 404, 'data': 'Not found'}
+        start = self._global(n, 1)
+        ayahs = [self._ayah_obj(g, edition) for g in range(start, start + self.surahs[n - 1]['verses'])]
+        return 200, {'code': 200, 'data': {'number': n, 'ayahs': ayahs}}
+
+    def juz(self, n, edition):
+        n = int(n)
+        if not 1 <= n <= 30:
+            return 404, {'code': 404, 'data': 'Not found'}
+        lo, hi = self.juz_ranges[n - 1]
+        return 200, {'code': 200, 'data': {'number': n, 'ayahs': [self._ayah_obj(g, edition) for g in range(lo, hi)]}}
+
+    def division(self, kind, n, edition):
+        n, total = int(n), {'page': 604, 'hizbQuarter': 240}[kind]
+        if not 1 <= n <= total:
+            return 404, {'code': 404, 'data': 'Not found'}
+        ayahs = [self._ayah_obj(g, edition) for g in range(1, len(self.ayahs) + 1)
+                 if 1 + (g - 1) * total // len(self.ayahs) == n]
+        return 200, {'code': 200, 'data': {'number': n, 'ayahs': ayahs}}
+
+    def ayah(self, s, a, edition=None):
+        s, a = int(s), int(a)
+        if not 1 <= s <= 114 or not 1 <= a <= self.surahs[s - 1]['verses']:
+            return 404, {'code': 404, 'data': 'Not found'}
+        return 200, {'code': 200, 'data': self._ayah_obj(self._global(s, a), edition)}
+
+    def quran(self, edition):
+        return 200, {'code': 200, 'data': {'surahs': [
+            {'number': s['id'], 'ayahs': self.surah(s['id'], edition)[1]['data']['ayahs']}
+            for s in self.surahs
+        ]}}
+
+    def search(self, query, lang):
+        matches = [{'number': g, 'text': self._text(g), 'numberInSurah': a,
+                    'surah': {'number': s, 'name': self.surahs[s - 1]['name']}}
+                   for g, s, a in self.ayahs[::97]]
+        return 200, {'code': 200, 'data': {'count': len(matches), 'matches': matches}}
+
+    def timings(self):
+        t = {k: '05:00' for k in ('Fajr', 'Sunrise', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')}
+        hijri = {'day': '1', 'month': {'ar': 'رمضان'}, 'year': '1447'}
+        return 200, {'code': 200, 'data': {'timings': t, 'date': {'hijri': hijri}}}
+
+    def hadith_edition(self, collection):
+        sections = {str(i): f"Section {i}" for i in range(1, 98)}
+        hadiths = [{'hadithnumber': i, 'text': self._text(i) * 3} for i in range(1, 300)]
+        return 200, {'metadata': {'name': collection, 'sections': sections}, 'hadiths': hadiths}
+
+    def hadith_section(self, collection, section):
+        hadiths = [{'hadithnumber': i, 'text': self._text(i) * 3} for i in range(1, 60)]
+        return 200, {'metadata': {'section': {section: f"Section {section}"}}, 'hadiths': hadiths}
+
+    def ip_geo(self):
+        return 200, {'success': True, 'latitude': 24.7136, 'longitude': 46.6753}
+
+    def dispatch(self, url):
+        path = urlparse(url).path
+        for pattern, handler in self.routes:
+            m = re.match(pattern, path)
+            if m:
+                return handler(*[x for x in m.groups() if x is not None])
+        return 404, {'code': 404, 'data': 'Not found'}
+
+
+class StubAdapter(BaseAdapter):
+    """requests transport adapter answering from a StubUpstream."""
+
+    def __init__(self, upstream, latency_ms=0):
+        super().__init__()
+        self.upstream = upstream
+        self.latency = latency_ms / 1000
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        status, payload = self.upstream.dispatch(request.url)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def morphology_corpus(surahs_meta, words_per_ayah=12, roots=1700, seed=0):
+    """Lines in the corpus morphology format, about the size of the real one."""
+    rnd = random.Random(seed)
+    letters = 'btvjHxdrzs$SDTZEgfqklmnhwy'
+    root_pool = [''.join(rnd.choice(letters) for _ in range(3)) for _ in range(roots)]
+    lines = ['LOCATION\tFORM\tTAG\tFEATURES\n']
+    for s in surahs_meta:
+        for a in range(1, s['verses'] + 1):
+            for w in range(1, words_per_ayah + 1):
+                root = rnd.choice(root_pool)
+                lines.append(f"({s['id']}:{a}:{w}:1)\twa\tCONJ\tPREFIX|w:CONJ+\n")
+                lines.append(f"({s['id']}:{a}:{w}:2)\t{root}a\tN\tSTEM|POS:N|LEM:{root}a|ROOT:{root}|M|NOM\n")
+    return lines
+
+
+def install(session, surahs_meta, latency_ms=0):
+    """Route every http(s) request made through `session` to the stub."""
+    adapter = StubAdapter(StubUpstream(surahs_meta), latency_ms=latency_ms)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return adapter
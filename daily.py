@@ -0,0 +1,189 @@
+"""
+Daily content — ayah, hadith and dhikr of the day from a precomputed,
+deterministic schedule.
+
+Every year gets its own schedule: the ayat are a seeded uniform sample of
+the 6236 global indices (no ayah repeats within a year), while hadith and
+adhkar cycle through seeded shuffles so each item comes up as evenly as
+the year allows. Texts are materialized offline into
+data/daily/<year>.json, so serving a day is a table lookup:
+
+    python daily.py --year 2027
+
+Without that file the app builds the table in a background thread and
+keeps it in memory only; request handlers never build or write.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from datetime import date, datetime
+from functools import lru_cache
+
+from quran_store import TOTAL_AYAHS
+
+logger = logging.getLogger(__name__)
+
+DAILY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'daily')
+SEED = 'islamic-daily'
+
+
+def _cycled(rnd, n, days):
+    order = []
+    while len(order) < days:
+        block = list(range(n))
+        rnd.shuffle(block)
+        order.extend(block)
+    return order[:days]
+
+
+@lru_cache(maxsize=4)
+def schedule(year, n_hadith=0, n_adhkar=0):
+    """Per-day (ayah global index, hadith index, dhikr index) for `year`."""
+    days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+    rnd = random.Random(f"{SEED}-{year}")
+    ayat = rnd.sample(range(TOTAL_AYAHS), days)
+    hadith = _cycled(rnd, n_hadith, days) if n_hadith else [None] * days
+    adhkar = _cycled(rnd, n_adhkar, days) if n_adhkar else [None] * days
+    return tuple(zip(ayat, hadith, adhkar))
+
+
+def materialize(year, store, translation, hadiths, adhkar):
+    """The year's table with texts filled in.
+
+    `store` is a loaded QuranStore or None, `translation` an aligned Column
+    or None. Without the store the ayah entries are None; without the text,
+    translation, hadiths or adhkar the table is marked incomplete and is not
+    persisted.
+    """
+    days = []
+    for g, h, d in schedule(year, len(hadiths), len(adhkar)):
+        if store is not None:
+            s, a = store.locate(g)
+            ayah = {'surah': s, 'ayah': a, 'text': store.text[g],
+                    'translation': translation[g] if translation is not None else None}
+        else:
+            ayah = None
+        days.append({
+            'ayah': ayah,
+            'hadith': hadiths[h] if h is not None else None,
+            'dhikr': adhkar[d] if d is not None else None,
+        })
+    return {
+        'year': year,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'complete': bool(store is not None and translation is not None and hadiths and adhkar),
+        'days': days,
+    }
+
+
+class DailyContent:
+    """Year tables, read from data/daily or installed by a background build.
+
+    Lookups only read: a missing table is never built under the lock or
+    written from a request. Built tables stay in memory; only the offline
+    CLI saves them.
+    """
+
+    def __init__(self, data_dir=DAILY_DIR, retry_after=3600):
+        self.data_dir = data_dir
+        self.retry_after = retry_after
+        self._tables = {}  # year -> (table, installed_at)
+        self._saved = set()  # years whose table was read from data/daily
+        self._checked = {}  # year -> when data/daily was last found without it
+        self._lock = threading.Lock()
+
+    def path(self, year):
+        return os.path.join(self.data_dir, f"{year}.json")
+
+    def table(self, year):
+        """Table for `year` from memory or data/daily, or None."""
+        hit = self._tables.get(year)
+        if hit:
+            return hit[0]
+        if time.time() - self._checked.get(year, 0) < self.retry_after:
+            return None
+        with self._lock:
+            hit = self._tables.get(year)
+            if hit:
+                return hit[0]
+            table = self._load(year)
+            if table is None or not table.get('complete'):
+                self._checked[year] = time.time()
+                return None
+            self._keep(table)
+            self._saved.add(year)
+            return table
+
+    def install(self, table):
+        """Serve a freshly built table from memory (not saved)."""
+        with self._lock:
+            self._keep(table)
+            self._saved.discard(table['year'])
+
+    def _keep(self, table):
+        year = table['year']
+        # Only the current year (and a neighbour around New Year) are needed
+        if year not in self._tables and len(self._tables) >= 2:
+            evicted = max(self._tables, key=lambda y: abs(y - year))
+            del self._tables[evicted]
+            self._saved.discard(evicted)
+        self._tables[year] = (table, time.time())
+
+    def needs_build(self, year):
+        """No table for `year`, or an incomplete one older than `retry_after`."""
+        hit = self._tables.get(year)
+        return not hit or (not hit[0]['complete'] and time.time() - hit[1] >= self.retry_after)
+
+    def loaded(self, year):
+        return year in self._tables
+
+    def saved(self, year):
+        """Whether `year`'s table is a complete one read from data/daily."""
+        return year in self._saved
+
+    def day(self, day):
+        """Entry for a date: {'ayah', 'hadith', 'dhikr'}, or None."""
+        table = self.table(day.year)
+        return table['days'][day.timetuple().tm_yday - 1] if table else None
+
+    def _load(self, year):
+        try:
+            with open(self.path(year), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Daily content: cannot read {self.path(year)}: {e}")
+            return None
+
+    def save(self, table):
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            tmp = self.path(table['year']) + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(table, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, self.path(table['year']))
+        except OSError as e:
+            logger.warning(f"Daily content: cannot write {self.path(table['year'])}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the daily content table for a year.")
+    parser.add_argument('--year', type=int, default=date.today().year)
+    args = parser.parse_args()
+
+    from app import build_daily
+    table = build_daily(args.year)
+    if not table or not table['complete']:
+        raise SystemExit("Sources unavailable; nothing written")
+    DailyContent().save(table)
+    print(f"Wrote {len(table['days'])} days to {DailyContent().path(args.year)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Gunicorn settings — `python serve.py` or `gunicorn -c gunicorn.conf.py wsgi:app`.
+
+Workers and threads scale with the CPU count and can be overridden with
+WEB_CONCURRENCY / THREADS. Requests spend most of their time waiting on
+upstream APIs, so each worker runs a thread pool (gthread).
+
+Zero-downtime reload, code included: `kill -USR2 <master>` starts a new
+master with fresh workers, then `kill -QUIT <old master>` once it is up.
+`kill -HUP <master>` gracefully replaces the workers but, because the app
+is preloaded, keeps the code and data the master loaded.
+"""
+
+import gc
+import multiprocessing
+import os
+
+_cpus = multiprocessing.cpu_count()
+
+bind = os.environ.get('BIND', f"0.0.0.0:{os.environ.get('PORT', 5000)}")
+workers = int(os.environ.get('WEB_CONCURRENCY', min(2 * _cpus + 1, 12)))
+worker_class = 'gthread'
+threads = int(os.environ.get('THREADS', 4))
+
+# Per-worker state: without RATELIMIT_STORAGE_URL each worker has its own
+# rate-limit buckets (full limit each, so limits are approximate), and
+# UPSTREAM_MAX_CONCURRENCY caps each worker, i.e. workers x that in total
+
+# Load the app (and its data, see app.preload; corpora too with
+# PRELOAD_FETCH=1) once, before forking
+preload_app = True
+
+timeout = int(os.environ.get('TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then so a slow leak never takes a node down;
+# the jitter keeps them from all restarting at once
+max_requests = int(os.environ.get('MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get('ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
+
+
+def when_ready(server):
+    # Preloaded objects live as long as the master; moving them out of the
+    # collector's reach stops its refcount/gc writes from un-sharing the
+    # pages each worker inherited
+    gc.freeze()
+    server.log.info(f"Ready: {workers} workers x {threads} threads")
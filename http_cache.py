@@ -0,0 +1,94 @@
+"""
+HTTP caching — fingerprinted static assets and per-endpoint Cache-Control.
+
+- StaticVersions hashes every file under static/ once at startup and makes
+  url_for('static', filename=...) emit `?v=<hash>`. A request carrying the
+  current hash is served `immutable` for a year; anything else (old hash,
+  no hash) gets a short, revalidating max-age.
+- cache_for(...) declares a view's policy next to its route; it only
+  applies to successful responses and never overrides a header the view
+  set itself.
+"""
+
+import functools
+import hashlib
+import os
+
+from flask import request, make_response
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+UNVERSIONED = 'public, max-age=300, must-revalidate'
+
+
+class StaticVersions:
+    """Content hashes of static/ files: {relative path: 10-char hash}."""
+
+    def __init__(self, app=None):
+        self.hashes = {}
+        self.version = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.refresh()
+        app.before_request(self._refresh_in_debug)
+        app.url_defaults(self._url_defaults)
+        app.after_request(self._static_headers)
+
+    def refresh(self):
+        hashes = {}
+        root = self.app.static_folder
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()[:10]
+                hashes[os.path.relpath(path, root).replace(os.sep, '/')] = digest
+        self.hashes = hashes
+        # One version for the whole set, e.g. for the service worker's cache name
+        self.version = hashlib.sha256(''.join(f"{k}:{v}" for k, v in sorted(hashes.items())).encode()).hexdigest()[:10]
+
+    def _refresh_in_debug(self):
+        if self.app.debug:
+            self.refresh()  # pick up edits without a restart
+
+    def url(self, filename):
+        """Fingerprinted URL path for a static file (as emitted by url_for)."""
+        digest = self.hashes.get(filename)
+        return f"{self.app.static_url_path}/{filename}" + (f"?v={digest}" if digest else '')
+
+    def _url_defaults(self, endpoint, values):
+        if endpoint == 'static' and 'v' not in values:
+            digest = self.hashes.get(values.get('filename'))
+            if digest:
+                values['v'] = digest
+
+    def _static_headers(self, response):
+        if request.endpoint != 'static' or response.status_code not in (200, 304):
+            return response
+        filename = request.view_args.get('filename') if request.view_args else None
+        current = self.hashes.get(filename)
+        if current and request.args.get('v') == current:
+            response.headers['Cache-Control'] = IMMUTABLE
+        else:
+            response.headers['Cache-Control'] = UNVERSIONED
+        return response
+
+
+def cache_for(max_age, stale_while_revalidate=0, private=False):
+    """Cache-Control for a view's 2xx responses, e.g. @cache_for(86400, stale_while_revalidate=3600)."""
+    parts = ['private' if private else 'public', f"max-age={max_age}"]
+    if stale_while_revalidate:
+        parts.append(f"stale-while-revalidate={stale_while_revalidate}")
+    policy = ', '.join(parts)
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapped(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if 200 <= response.status_code < 300 and 'Cache-Control' not in response.headers:
+                response.headers['Cache-Control'] = policy
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,202 @@
+"""
+Word-level morphology — lemma, root and part of speech for every word of
+the Quran, from the Quranic Arabic Corpus morphology file, kept in flat
+arrays indexed by word position with a root -> occurrences index.
+
+The corpus is not shipped; download `quranic-corpus-morphology-0.4.txt`
+from corpus.quran.com and save it as data/quran/morphology.txt. Lookups
+are constant time: a word is `word_starts[ayah] + n`, a root is one dict
+hit plus a slice of its occurrence list.
+"""
+
+import logging
+import os
+import threading
+from array import array
+from bisect import bisect_right
+
+from quran_store import DATA_DIR, TOTAL_AYAHS, Column
+
+logger = logging.getLogger(__name__)
+
+MORPHOLOGY_PATH = os.path.join(DATA_DIR, 'morphology.txt')
+
+# Extended Buckwalter transliteration used by the corpus
+BUCKWALTER = {
+    "'": 'ء', '>': 'أ', '&': 'ؤ', '<': 'إ', '}': 'ئ',
+    'A': 'ا', 'b': 'ب', 'p': 'ة', 't': 'ت', 'v': 'ث',
+    'j': 'ج', 'H': 'ح', 'x': 'خ', 'd': 'د', '*': 'ذ',
+    'r': 'ر', 'z': 'ز', 's': 'س', '$': 'ش', 'S': 'ص',
+    'D': 'ض', 'T': 'ط', 'Z': 'ظ', 'E': 'ع', 'g': 'غ',
+    '_': '\u0640', 'f': 'ف', 'q': 'ق', 'k': 'ك', 'l': 'ل',
+    'm': 'م', 'n': 'ن', 'h': 'ه', 'w': 'و', 'Y': 'ى',
+    'y': 'ي', 'F': '\u064b', 'N': '\u064c', 'K': '\u064d', 'a': '\u064e',
+    'u': '\u064f', 'i': '\u0650', '~': '\u0651', 'o': '\u0652', '^': '\u0653',
+    '#': '\u0654', '`': '\u0670', '{': 'ٱ', '|': 'آ', ':': '\u06dc',
+    '@': '\u06df', '"': '\u06e0', '[': '\u06e2', ';': '\u06e3', ',': '\u06e5',
+    '.': '\u06e6', '!': '\u06e8', '-': '\u06ed', '+': '\u06ea', '%': '\u06eb',
+    ']': '\u06ec',
+}
+_TO_ARABIC = str.maketrans(BUCKWALTER)
+_FROM_ARABIC = str.maketrans({v: k for k, v in BUCKWALTER.items()})
+
+
+def to_arabic(text):
+    return text.translate(_TO_ARABIC)
+
+
+def to_buckwalter(text):
+    return text.translate(_FROM_ARABIC)
+
+
+class _Table:
+    """String interning: id 0 is the empty string (no value)."""
+
+    def __init__(self):
+        self.values = ['']
+        self.ids = {'': 0}
+
+    def add(self, value):
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+
+class Morphology:
+    """Per-word lemma/root/POS arrays for the whole Quran, loaded on first use."""
+
+    def __init__(self, surah_starts, path=MORPHOLOGY_PATH):
+        self.surah_starts = surah_starts
+        self.path = path
+        self.word_starts = None  # array('I'), TOTAL_AYAHS + 1 entries
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self.word_starts is not None
+
+    def ensure_loaded(self):
+        if self.word_starts is not None:
+            return True
+        with self._lock:
+            if self.word_starts is not None:
+                return True
+            if not os.path.exists(self.path):
+                return False
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.build(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Morphology: cannot load {self.path}: {e}")
+                return False
+            return True
+
+    def build(self, lines):
+        """Index corpus lines: `(surah:ayah:word:segment)<TAB>form<TAB>tag<TAB>features`."""
+        forms, lemmas, roots, tags = [], _Table(), _Table(), _Table()
+        word_ayah, word_lemma, word_root, word_pos = array('H'), array('H'), array('H'), array('B')
+        counts = array('H', bytes(2 * TOTAL_AYAHS))
+        key, parts = None, []
+        last_g = 0
+
+        def flush():
+            forms.append(''.join(parts))
+            word_ayah.append(g_of_key)
+            word_lemma.append(lemma)
+            word_root.append(root)
+            word_pos.append(pos)
+            counts[g_of_key] += 1
+
+        g_of_key = lemma = root = pos = 0
+        for line in lines:
+            if not line.startswith('('):
+                continue  # comments and the column header
+            loc, form, tag, features = line.rstrip('\n').split('\t')
+            s, a, w, _ = loc[1:-1].split(':')
+            if (s, a, w) != key:
+                if key is not None:
+                    flush()
+                g = self.surah_starts[int(s) - 1] + int(a) - 1
+                if g < last_g:
+                    raise ValueError(f"words out of order at {loc}")
+                key, parts, last_g = (s, a, w), [], g
+                g_of_key, lemma, root, pos = g, 0, 0, 0
+            parts.append(form)
+            feats = features.split('|')
+            if feats[0] == 'STEM':
+                pos = tags.add(tag)
+                for f in feats[1:]:
+                    if f.startswith('LEM:'):
+                        lemma = lemmas.add(f[4:])
+                    elif f.startswith('ROOT:'):
+                        root = roots.add(f[5:])
+        if key is not None:
+            flush()
+
+        word_starts = array('I', [0])
+        for c in counts:
+            word_starts.append(word_starts[-1] + c)
+
+        # Root index in CSR form: root id r owns root_words[root_offsets[r]:root_offsets[r + 1]]
+        root_offsets = array('I', bytes(4 * (len(roots.values) + 1)))
+        for r in word_root:
+            root_offsets[r + 1] += 1
+        for r in range(len(roots.values)):
+            root_offsets[r + 1] += root_offsets[r]
+        fill = array('I', root_offsets)
+        root_words = array('I', bytes(4 * len(word_root)))
+        for i, r in enumerate(word_root):
+            root_words[fill[r]] = i
+            fill[r] += 1
+
+        self.forms = Column(forms)
+        self.lemmas, self.roots, self.tags = lemmas, roots, tags
+        self.word_ayah, self.word_lemma, self.word_root, self.word_pos = word_ayah, word_lemma, word_root, word_pos
+        self.root_offsets, self.root_words = root_offsets, root_words
+        self.word_starts = word_starts
+        logger.info(f"Morphology: {len(forms)} words, {len(roots.values) - 1} roots, {len(lemmas.values) - 1} lemmas")
+
+    # ── Lookups ───────────────────────────────────────────
+
+    def _position(self, i):
+        g = self.word_ayah[i]
+        s = bisect_right(self.surah_starts, g)
+        return s, g - self.surah_starts[s - 1] + 1, i - self.word_starts[g] + 1
+
+    def word(self, surah, ayah, n):
+        """Morphology of word `n` (1-based) of an ayah, or None."""
+        g = self.surah_starts[surah - 1] + ayah - 1
+        i = self.word_starts[g] + n - 1
+        if n < 1 or i >= self.word_starts[g + 1]:
+            return None
+        root = self.roots.values[self.word_root[i]]
+        lemma = self.lemmas.values[self.word_lemma[i]]
+        return {
+            'surah': surah, 'ayah': ayah, 'word': n,
+            'form': to_arabic(self.forms[i]),
+            'lemma': to_arabic(lemma) or None,
+            'root': to_arabic(root) or None,
+            'pos': self.tags.values[self.word_pos[i]] or None,
+        }
+
+    def root_id(self, root):
+        """Id of a root given in Arabic or Buckwalter, or None."""
+        root = to_buckwalter(root.replace(' ', ''))
+        return self.roots.ids.get(root) or None
+
+    def occurrences(self, root_id, offset=0, limit=None):
+        """(total, [(surah, ayah, word), ...]) for a root, in reading order."""
+        start, end = self.root_offsets[root_id], self.root_offsets[root_id + 1]
+        first = start + offset
+        last = end if limit is None else min(end, first + limit)
+        return end - start, [self._position(i) for i in self.root_words[first:last]]
+
+    def root_lemmas(self, root_id):
+        """Distinct lemmas derived from a root, most frequent first."""
+        counts = {}
+        for i in self.root_words[self.root_offsets[root_id]:self.root_offsets[root_id + 1]]:
+            lemma = self.word_lemma[i]
+            counts[lemma] = counts.get(lemma, 0) + 1
+        return [to_arabic(self.lemmas.values[l]) for l, _ in sorted(counts.items(), key=lambda kv: -kv[1]) if l]
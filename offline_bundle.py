@@ -0,0 +1,118 @@
+"""
+Offline bundle for the PWA — the Quran text, selected translations, adhkar
+and the Names of Allah packaged as content-hashed, gzipped chunks plus a
+manifest, so the service worker can fetch everything in a few requests and
+later download only the chunks whose hash changed.
+
+    python offline_bundle.py                       # quran-uthmani + en.sahih
+    python offline_bundle.py --editions en.sahih,fr.hamidullah
+
+Chunks are written to data/offline/ and served by the /offline/ route.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from quran_store import BASE_EDITION, CORPUS_URL, DATA_DIR as QURAN_DIR, QuranStore, parse_corpus
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_DIR = os.path.join(ROOT, 'data', 'offline')
+MANIFEST = 'manifest.json'
+JUZ_PER_CHUNK = 5
+DEFAULT_EDITIONS = ['en.sahih']
+
+
+def _write_chunk(out_dir, name, payload, **info):
+    """Serialize, hash and gzip one chunk; returns its manifest entry."""
+    raw = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    digest = hashlib.sha256(raw).hexdigest()[:12]
+    filename = f"{name}.{digest}.json.gz"
+    path = os.path.join(out_dir, filename)
+    if not os.path.exists(path):
+        # mtime=0 keeps the gzip bytes reproducible for identical content
+        with open(path, 'wb') as f:
+            f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+    return {'name': name, 'file': filename, 'hash': digest, 'bytes': len(raw),
+            'gzip_bytes': os.path.getsize(path), **info}
+
+
+def _edition_texts(store, edition, fetch):
+    if edition == BASE_EDITION:
+        return list(store.text)
+    local = os.path.join(QURAN_DIR, f"{edition}.txt")
+    if os.path.exists(local):
+        with open(local, encoding='utf-8') as f:
+            return f.read().split('\n')
+    texts, _ = parse_corpus(fetch(CORPUS_URL.format(edition=edition)))
+    return texts
+
+
+def build(surahs_meta, editions=None, out_dir=BUNDLE_DIR, fetch=None):
+    """Write all chunks and the manifest; stale chunk files are removed."""
+    if fetch is None:
+        import requests
+
+        def fetch(url):
+            r = requests.get(url, timeout=120)
+            r.raise_for_status()
+            return r.json()
+
+    store = QuranStore(surahs_meta)
+    if not store.ensure_loaded(fetch):
+        raise RuntimeError("Quran corpus unavailable (run `python quran_store.py` first)")
+    os.makedirs(out_dir, exist_ok=True)
+
+    chunks = [_write_chunk(out_dir, 'meta', {
+        'surahs': surahs_meta,
+        'juz': [g + 1 for g in store.index['juz'][:-1]],
+    }, kind='meta')]
+
+    for edition in [BASE_EDITION] + [e for e in (editions or DEFAULT_EDITIONS) if e != BASE_EDITION]:
+        texts = _edition_texts(store, edition, fetch)
+        for first in range(1, 31, JUZ_PER_CHUNK):
+            last = min(first + JUZ_PER_CHUNK - 1, 30)
+            start = store.bounds('juz', first)[0]
+            end = store.bounds('juz', last)[1]
+            chunks.append(_write_chunk(out_dir, f"{edition}-juz{first}-{last}", {
+                'edition': edition, 'start': start + 1, 'texts': texts[start:end],
+            }, kind='quran', edition=edition, start=start + 1, end=end))
+
+    for name in ('adhkar', 'names'):
+        with open(os.path.join(ROOT, 'data', f"{name}.json"), encoding='utf-8') as f:
+            chunks.append(_write_chunk(out_dir, name, json.load(f), kind=name))
+
+    version = hashlib.sha256(''.join(c['hash'] for c in chunks).encode()).hexdigest()[:12]
+    manifest = {
+        'version': version,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'chunks': chunks,
+    }
+    with open(os.path.join(out_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+    keep = {c['file'] for c in chunks} | {MANIFEST}
+    for filename in os.listdir(out_dir):
+        if filename not in keep and filename.endswith('.json.gz'):
+            os.remove(os.path.join(out_dir, filename))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the PWA offline bundle.")
+    parser.add_argument('--editions', default=','.join(DEFAULT_EDITIONS),
+                        help='comma-separated translation editions to include')
+    parser.add_argument('--out', default=BUNDLE_DIR)
+    args = parser.parse_args()
+
+    from app import SURAHS_META
+    manifest = build(SURAHS_META, [e for e in args.editions.split(',') if e], args.out)
+    total = sum(c['gzip_bytes'] for c in manifest['chunks'])
+    print(f"Bundle {manifest['version']}: {len(manifest['chunks'])} chunks, {total / 1024:.0f} KiB gzipped -> {args.out}")
+
+
+if __name__ == '__main__':
+    main()
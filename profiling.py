@@ -0,0 +1,204 @@
+"""
+Per-request profiling — span breakdown and slow-request traces.
+
+Opt-in: a request is profiled when it carries the profile header with the
+configured token, or when it is picked by the sampling rate. Profiled
+responses get a `Server-Timing` header; those slower than the threshold are
+kept (with their cProfile / pyinstrument report) in a bounded ring buffer
+that can be read at /admin/profiles (with an `X-Admin-Token` header).
+"""
+
+import cProfile
+import io
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from flask import g, request, has_request_context, jsonify, make_response, abort
+from flask import before_render_template, template_rendered
+
+# Optional: pyinstrument gives a much more readable call tree
+try:
+    from pyinstrument import Profiler as Pyinstrument
+except ImportError:
+    Pyinstrument = None
+
+SPANS = ('upstream', 'cache', 'build', 'render', 'compress')
+
+
+class RequestProfiler:
+    """Collects span timings per request and keeps traces of slow ones."""
+
+    def __init__(self, app=None):
+        self.traces = deque(maxlen=50)
+        self._next_id = 1
+        self._lock = threading.Lock()
+        # cProfile can only hook one request at a time per process
+        self._engine_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PROFILE_TOKEN', None)
+        app.config.setdefault('PROFILE_HEADER', 'X-Profile')
+        app.config.setdefault('PROFILE_SAMPLE_RATE', 0.0)
+        app.config.setdefault('PROFILE_SLOW_MS', 500)
+        app.config.setdefault('PROFILE_BUFFER_SIZE', 50)
+        app.config.setdefault('PROFILE_ENGINE', 'cprofile')
+        self.app = app
+        self.traces = deque(maxlen=int(app.config['PROFILE_BUFFER_SIZE']))
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+        before_render_template.connect(self._render_start, app)
+        template_rendered.connect(self._render_end, app)
+
+        app.add_url_rule('/admin/profiles', 'admin_profiles', self.list_view)
+        app.add_url_rule('/admin/profiles/<int:trace_id>', 'admin_profile_detail', self.detail_view)
+
+    # ── Span API ──────────────────────────────────────────
+
+    @staticmethod
+    def active():
+        return has_request_context() and '_profile' in g
+
+    @contextmanager
+    def span(self, name):
+        """Time a block and add it to the current request's `name` span."""
+        if not self.active():
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            g._profile['spans'][name] += time.perf_counter() - t0
+
+    # ── Request hooks ─────────────────────────────────────
+
+    def _wanted(self):
+        cfg = self.app.config
+        header = request.headers.get(cfg['PROFILE_HEADER'])
+        if header:
+            token = cfg['PROFILE_TOKEN']
+            if (token and header == token) or (not token and self.app.debug):
+                return True
+        rate = float(cfg['PROFILE_SAMPLE_RATE'] or 0)
+        return rate > 0 and random.random() < rate
+
+    def _start(self):
+        if request.path.startswith('/admin/profiles') or not self._wanted():
+            return
+        engine = None
+        if self._engine_lock.acquire(blocking=False):
+            try:
+                if Pyinstrument and self.app.config['PROFILE_ENGINE'] == 'pyinstrument':
+                    engine = Pyinstrument()
+                    engine.start()
+                else:
+                    engine = cProfile.Profile()
+                    engine.enable()
+            except Exception:
+                self._engine_lock.release()
+                engine = None
+        g._profile = {
+            'start': time.perf_counter(),
+            'spans': dict.fromkeys(SPANS, 0.0),
+            'engine': engine,
+        }
+
+    def _render_start(self, sender, template, context, **extra):
+        if self.active():
+            g._profile['render_t0'] = time.perf_counter()
+
+    def _render_end(self, sender, template, context, **extra):
+        if self.active() and 'render_t0' in g._profile:
+            g._profile['spans']['render'] += time.perf_counter() - g._profile.pop('render_t0')
+
+    def _finish(self, response):
+        if not self.active():
+            return response
+        prof = g.pop('_profile')
+        total = time.perf_counter() - prof['start']
+        spans = prof['spans']
+        engine = prof['engine']
+        if engine is not None:
+            self._stop(engine)
+
+        # Whatever the view spent outside fetching and rendering is "build"
+        handler = total - spans['compress']
+        spans['build'] = max(0.0, handler - spans['upstream'] - spans['cache'] - spans['render'])
+
+        response.headers['Server-Timing'] = ', '.join(
+            f"{name};dur={spans[name] * 1000:.2f}" for name in SPANS
+        ) + f", total;dur={total * 1000:.2f}"
+
+        total_ms = total * 1000
+        if total_ms >= float(self.app.config['PROFILE_SLOW_MS']):
+            report = self._report(engine) if engine is not None else None
+            with self._lock:
+                trace_id = self._next_id
+                self._next_id += 1
+                self.traces.append({
+                    'id': trace_id,
+                    'time': datetime.now().isoformat(timespec='seconds'),
+                    'method': request.method,
+                    'path': request.full_path.rstrip('?'),
+                    'status': response.status_code,
+                    'total_ms': round(total_ms, 2),
+                    'spans_ms': {k: round(v * 1000, 2) for k, v in spans.items()},
+                    'report': report,
+                })
+        return response
+
+    def _teardown(self, exc):
+        # The response never reached _finish (e.g. an after_request hook raised)
+        prof = g.pop('_profile', None)
+        if prof and prof['engine'] is not None:
+            self._stop(prof['engine'])
+
+    def _stop(self, engine):
+        try:
+            if Pyinstrument and isinstance(engine, Pyinstrument):
+                engine.stop()
+            else:
+                engine.disable()
+        finally:
+            self._engine_lock.release()
+
+    @staticmethod
+    def _report(engine):
+        if Pyinstrument and isinstance(engine, Pyinstrument):
+            return engine.output_text(unicode=True)
+        out = io.StringIO()
+        pstats.Stats(engine, stream=out).sort_stats('cumulative').print_stats(40)
+        return out.getvalue()
+
+    # ── Admin endpoints ───────────────────────────────────
+
+    def _check_admin(self):
+        # Header only: a query-string token would end up in the access log
+        token = self.app.config['PROFILE_TOKEN']
+        if not token or request.headers.get('X-Admin-Token') != token:
+            abort(404)
+
+    def list_view(self):
+        self._check_admin()
+        with self._lock:
+            traces = [{k: v for k, v in t.items() if k != 'report'} for t in reversed(self.traces)]
+        return jsonify({'slow_ms': self.app.config['PROFILE_SLOW_MS'], 'traces': traces})
+
+    def detail_view(self, trace_id):
+        self._check_admin()
+        with self._lock:
+            trace = next((t for t in self.traces if t['id'] == trace_id), None)
+        if not trace:
+            abort(404)
+        response = make_response(trace['report'] or 'No profiler report recorded for this request.')
+        response.headers['Content-Type'] = 'text/plain; charset=utf-8'
+        return response
@@ -0,0 +1,353 @@
+"""
+Verse store — the Quran text held in memory by global ayah index, plus a
+boundary index mapping juz, hizb, quarter (rub' al-hizb) and mushaf page
+to ayah ranges.
+
+Translation and tafsir editions are kept the same way, one packed column
+per edition aligned with the Arabic text by global index, so a parallel
+view of several editions is a single zip over aligned ranges.
+
+The data lives in data/quran/ and is built once from the corpus:
+
+    python quran_store.py                          # quran-uthmani.txt + index.json
+    python quran_store.py --editions en.sahih,fr.hamidullah
+
+The boundary index ships with the repo (data/quran/index.json: mushaf pages
+from the quran-text dataset, rub' al-hizb starts from Tanzil's quran-data)
+and is read at construction, so juz, hizb and page ranges are known without
+the text. If the text files are missing, each
+edition builds itself from a single upstream fetch of its full corpus.
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'quran')
+CORPUS_URL = "https://api.alquran.cloud/v1/quran/{edition}"
+BASE_EDITION = 'quran-uthmani'
+TOTAL_AYAHS = 6236
+
+# Standard juz start positions (surah, ayah) — also the fallback when no
+# index file has been built yet.
+JUZ_STARTS = [
+    (1, 1), (2, 142), (2, 253), (3, 93), (4, 24), (4, 148), (5, 82), (6, 111),
+    (7, 88), (8, 41), (9, 93), (11, 6), (12, 53), (15, 1), (17, 1), (18, 75),
+    (21, 1), (23, 1), (25, 21), (27, 56), (29, 46), (33, 31), (36, 28), (39, 32),
+    (41, 47), (46, 1), (51, 31), (58, 1), (67, 1), (78, 1),
+]
+
+# Division sizes
+DIVISIONS = {'juz': 30, 'hizb': 60, 'quarter': 240, 'page': 604}
+
+# One ayah across editions: number within its surah, Arabic text, and the
+# texts of the requested editions in order
+VerseRow = namedtuple('VerseRow', 'number text translations')
+
+
+class Column:
+    """One edition's text: a single packed string plus an offsets array."""
+
+    __slots__ = ('_text', '_offsets')
+
+    def __init__(self, texts):
+        offsets = array('I', [0])
+        pos = 0
+        for t in texts:
+            pos += len(t)
+            offsets.append(pos)
+        self._text = ''.join(texts)
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self._text[self._offsets[i]:self._offsets[i + 1]]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def between(self, start, end):
+        """Texts of [start, end), lazily — nothing is materialized up front."""
+        text, offsets = self._text, self._offsets
+        return (text[offsets[i]:offsets[i + 1]] for i in range(start, end))
+
+
+class QuranStore:
+    """Global-index verse store. Ayat are addressed 0-based internally."""
+
+    def __init__(self, surahs_meta, data_dir=DATA_DIR):
+        self.surahs = surahs_meta
+        self.data_dir = data_dir
+        starts = array('H', [0])
+        for s in surahs_meta:
+            starts.append(starts[-1] + s['verses'])
+        self.surah_starts = starts  # 115 entries, last one == TOTAL_AYAHS
+        self.text = None
+        self.index = {'juz': array('H', [self.global_index(s, a) for s, a in JUZ_STARTS] + [TOTAL_AYAHS])}
+        self._set_index(self._load_index())
+        self._lock = threading.Lock()
+        self._failed_at = 0
+
+    # ── Addressing ────────────────────────────────────────
+
+    def global_index(self, surah, ayah):
+        return self.surah_starts[surah - 1] + ayah - 1
+
+    def locate(self, g):
+        """Global index -> (surah, ayah)."""
+        s = bisect_right(self.surah_starts, g)
+        return s, g - self.surah_starts[s - 1] + 1
+
+    def bounds(self, kind, n):
+        """Global [start, end) range of division `kind` number `n` (1-based), or None."""
+        if kind == 'hizb':
+            quarters = self.index.get('quarter')
+            if not quarters or not 1 <= n <= DIVISIONS['hizb']:
+                return None
+            return quarters[4 * (n - 1)], quarters[4 * n]
+        starts = self.index.get(kind)
+        if not starts or not 1 <= n <= DIVISIONS[kind]:
+            return None
+        return starts[n - 1], starts[n]
+
+    def division_of(self, kind, g):
+        """Which `kind` (juz/quarter/page) the global ayah index falls in, 1-based."""
+        starts = self.index.get(kind)
+        return bisect_right(starts, g) if starts else None
+
+    # ── Loading ───────────────────────────────────────────
+
+    @property
+    def loaded(self):
+        return self.text is not None
+
+    def ensure_loaded(self, fetch=None, retry_after=300, busy=()):
+        """Load from data/quran, or from the corpus via `fetch(url)` -> JSON.
+
+        A failed upstream build is not retried for `retry_after` seconds.
+        Exceptions in `busy` (the fetch could not start yet) propagate
+        without starting that backoff.
+        """
+        if self.text is not None:
+            return True
+        with self._lock:
+            if self.text is not None:
+                return True
+            if self._load_files():
+                return True
+            if fetch is None or time.time() - self._failed_at < retry_after:
+                return False
+            try:
+                texts, index = parse_corpus(fetch(CORPUS_URL.format(edition=BASE_EDITION)))
+            except busy:
+                raise
+            except Exception as e:
+                logger.warning(f"Verse store: corpus build failed: {e}")
+                self._failed_at = time.time()
+                return False
+            self._install(texts, index)
+            logger.info("Verse store built from upstream corpus")
+            return True
+
+    def _load_index(self):
+        path = os.path.join(self.data_dir, 'index.json')
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError as e:
+            logger.warning(f"Verse store: {path} unreadable: {e}")
+            return {}
+
+    def _set_index(self, index):
+        for kind in DIVISIONS:
+            if kind != 'hizb' and len(index.get(kind) or ()) == DIVISIONS[kind]:
+                # Stored 1-based global numbers of each division's first ayah
+                self.index[kind] = array('H', [n - 1 for n in index[kind]] + [TOTAL_AYAHS])
+
+    def _load_files(self):
+        text_path = os.path.join(self.data_dir, f"{BASE_EDITION}.txt")
+        if not os.path.exists(text_path):
+            return False
+        with open(text_path, encoding='utf-8') as f:
+            texts = f.read().split('\n')[:TOTAL_AYAHS]
+        if len(texts) != TOTAL_AYAHS:
+            logger.warning(f"Verse store: {text_path} has {len(texts)} ayat, expected {TOTAL_AYAHS}")
+            return False
+        self._install(texts, {})
+        return True
+
+    def _install(self, texts, index):
+        self._set_index(index)
+        self.text = Column(texts)
+
+    # ── Views ─────────────────────────────────────────────
+
+    def grouped(self, start, end, reciter='ar.alafasy'):
+        """Ayat in [start, end) grouped by surah, in reading order."""
+        groups = []
+        g = start
+        while g < end:
+            s, a = self.locate(g)
+            meta = self.surahs[s - 1]
+            stop = min(end, self.surah_starts[s])
+            groups.append({
+                'number': s,
+                'name': meta['name'],
+                'englishName': meta['name_en'],
+                'verses': [{
+                    'number': a + i,
+                    'text': self.text[gi],
+                    'audio': f"https://cdn.islamic.network/quran/audio/128/{reciter}/{gi + 1}.mp3",
+                    'global_number': gi + 1,
+                } for i, gi in enumerate(range(g, stop))],
+            })
+            g = stop
+        return groups
+
+
+class EditionStore:
+    """Translation/tafsir editions as Columns aligned by global ayah index.
+
+    Each edition is loaded on first request, from data/quran/<edition>.txt or
+    one upstream corpus fetch, and costs only its packed text afterwards.
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        self.columns = {}
+        self._lock = threading.Lock()
+        self._failed_at = {}
+
+    def get(self, edition, fetch=None, retry_after=300, busy=()):
+        """Column for `edition`, or None if it cannot be loaded right now.
+
+        Takes the same `retry_after` / `busy` as QuranStore.ensure_loaded.
+        """
+        column = self.columns.get(edition)
+        if column is not None:
+            return column
+        with self._lock:
+            column = self.columns.get(edition)
+            if column is not None:
+                return column
+            texts = self._load_file(edition)
+            if texts is None:
+                if fetch is None or time.time() - self._failed_at.get(edition, 0) < retry_after:
+                    return None
+                try:
+                    texts, _ = parse_corpus(fetch(CORPUS_URL.format(edition=edition)))
+                except busy:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Edition store: {edition} build failed: {e}")
+                    self._failed_at[edition] = time.time()
+                    return None
+                logger.info(f"Edition store: {edition} built from upstream corpus")
+            column = self.columns[edition] = Column(texts)
+            return column
+
+    def _load_file(self, edition):
+        path = os.path.join(self.data_dir, f"{edition}.txt")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            texts = f.read().split('\n')[:TOTAL_AYAHS]
+        if len(texts) != TOTAL_AYAHS:
+            logger.warning(f"Edition store: {path} has {len(texts)} ayat, expected {TOTAL_AYAHS}")
+            return None
+        return texts
+
+    @staticmethod
+    def rows(text, columns, start, end, first_number=1):
+        """VerseRows for global ayat [start, end): one pass zipping `text`
+        (the Arabic column) with each edition column."""
+        ranges = [c.between(start, end) for c in columns]
+        return [VerseRow(n, arabic, others)
+                for n, (arabic, *others) in enumerate(zip(text.between(start, end), *ranges), first_number)]
+
+
+def parse_corpus(data):
+    """alquran.cloud /v1/quran/<edition> JSON -> (texts, boundary index)."""
+    texts = []
+    index = {'juz': [], 'quarter': [], 'page': []}
+    last = {'juz': 0, 'quarter': 0, 'page': 0}
+    fields = {'juz': 'juz', 'quarter': 'hizbQuarter', 'page': 'page'}
+    for surah in data['data']['surahs']:
+        for ayah in surah['ayahs']:
+            texts.append(ayah['text'].replace('\n', ' '))
+            for kind, field in fields.items():
+                value = ayah.get(field)
+                if value and value != last[kind]:
+                    index[kind].append(len(texts))
+                    last[kind] = value
+    if len(texts) != TOTAL_AYAHS:
+        raise ValueError(f"corpus has {len(texts)} ayat, expected {TOTAL_AYAHS}")
+    return texts, {k: v for k, v in index.items() if len(v) == DIVISIONS[k]}
+
+
+def collect_surahs(url_template, surahs_meta, fetch):
+    """Texts of an edition published one surah per file ({"ayahs": [{"ayah", "text"}]}).
+
+    `url_template` takes `{surah}`; missing ayat are left empty.
+    """
+    texts = []
+    for s in surahs_meta:
+        ayahs = {a['ayah']: a['text'] for a in fetch(url_template.format(surah=s['id']))['ayahs']}
+        texts.extend(ayahs.get(n, '').replace('\n', ' ') for n in range(1, s['verses'] + 1))
+    return texts
+
+
+def build(data_dir=DATA_DIR, editions=(), surah_sources=None, surahs_meta=None):
+    """Fetch each corpus once and write the compact text (+ index) files.
+
+    Editions listed in `surah_sources` are assembled from per-surah files.
+    """
+    import requests
+
+    def fetch(url):
+        r = requests.get(url, timeout=120)
+        r.raise_for_status()
+        return r.json()
+
+    os.makedirs(data_dir, exist_ok=True)
+    for edition in [BASE_EDITION, *editions]:
+        if edition in (surah_sources or {}):
+            texts, index = collect_surahs(surah_sources[edition], surahs_meta, fetch), {}
+        else:
+            texts, index = parse_corpus(fetch(CORPUS_URL.format(edition=edition)))
+        with open(os.path.join(data_dir, f"{edition}.txt"), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(texts))
+        if edition == BASE_EDITION:
+            with open(os.path.join(data_dir, 'index.json'), 'w', encoding='utf-8') as f:
+                json.dump({'source': CORPUS_URL.format(edition=BASE_EDITION), **index}, f, separators=(',', ':'))
+            print(f"Wrote {len(texts)} ayat and {', '.join(index)} boundaries to {data_dir}")
+        else:
+            print(f"Wrote {len(texts)} ayat of {edition} to {data_dir}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the local Quran text, index and edition files.")
+    parser.add_argument('--editions', default='', help='comma-separated translation/tafsir editions to add')
+    parser.add_argument('--out', default=DATA_DIR)
+    parser.add_argument('--tafsir-ref', default=os.environ.get('TAFSIR_API_REF', 'main'),
+                        help='spa5k/tafsir_api commit to build per-surah tafsir editions from')
+    args = parser.parse_args()
+    from tables import SURAHS_META, TAFSIR_SOURCES
+    sources = {e: url.format(ref=args.tafsir_ref, surah='{surah}') for e, url in TAFSIR_SOURCES.items()}
+    build(args.out, [e for e in args.editions.split(',') if e and e != BASE_EDITION], sources, SURAHS_META)
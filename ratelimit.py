@@ -0,0 +1,164 @@
+"""
+Admission control for the upstream-proxying endpoints.
+
+- RateLimiter: token bucket per (client, endpoint). Buckets live in Redis
+  when RATELIMIT_STORAGE_URL is set, so every worker spends from the same
+  one and the limits are exact. Otherwise each worker keeps its own in
+  memory with the full limit: a client held on one keep-alive connection
+  gets exactly that, one spread over N workers up to N times it.
+  Over the limit the request gets 429 + Retry-After.
+- UpstreamGate: a cap on concurrent upstream fetches in this process (so
+  N workers allow up to N times it); callers that cannot get a slot in
+  time raise UpstreamBusy instead of queueing.
+"""
+
+import functools
+import logging
+import math
+import threading
+import time
+
+from flask import request, jsonify, render_template, make_response
+
+# Optional: shared buckets across workers
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamBusy(Exception):
+    """No upstream fetch slot became free in time."""
+
+    def __init__(self, retry_after=1):
+        super().__init__('Upstream concurrency limit reached')
+        self.retry_after = retry_after
+
+
+class MemoryBackend:
+    """Token buckets in a dict: key -> (tokens, last_refill)."""
+
+    def __init__(self, max_keys=50000):
+        self.buckets = {}
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst):
+        """Spend one token; returns (allowed, seconds until the next token)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self.buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            if key not in self.buckets and len(self.buckets) >= self.max_keys:
+                self._prune(now)
+            self.buckets[key] = (tokens, now)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def _prune(self, now):
+        # Buckets idle for an hour have long refilled and carry no state
+        idle = [k for k, (t, last) in self.buckets.items() if now - last > 3600]
+        for k in idle or list(self.buckets)[:self.max_keys // 10]:
+            del self.buckets[k]
+
+
+class RedisBackend:
+    """Same buckets in Redis, refilled atomically by a Lua script."""
+
+    SCRIPT = """
+    local data = redis.call('HMGET', KEYS[1], 't', 'ts')
+    local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+    local tokens = tonumber(data[1]) or burst
+    local ts = tonumber(data[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+
+    def __init__(self, url):
+        self.client = redis.Redis.from_url(url, socket_timeout=0.2)
+        self.script = self.client.register_script(self.SCRIPT)
+        self.fallback = MemoryBackend()
+
+    def take(self, key, rate, burst):
+        try:
+            allowed, tokens = self.script(keys=[f"rl:{key}"], args=[rate, burst, time.time()])
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit backend unavailable, using memory: {e}")
+            return self.fallback.take(key, rate, burst)
+        return bool(allowed), 0 if allowed else (1 - float(tokens)) / rate
+
+
+class RateLimiter:
+    """Per-client, per-endpoint token buckets applied with @limiter.limit(...)."""
+
+    def __init__(self, app=None):
+        self.backend = MemoryBackend()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RATELIMIT_ENABLED', True)
+        app.config.setdefault('RATELIMIT_STORAGE_URL', None)
+        self.app = app
+        url = app.config['RATELIMIT_STORAGE_URL']
+        if url:
+            if redis is None:
+                logger.warning("RATELIMIT_STORAGE_URL set but redis is not installed; using memory")
+            else:
+                self.backend = RedisBackend(url)
+
+    def limit(self, name, per_minute, burst=None):
+        """Allow `per_minute` requests per client, with bursts of up to `burst`."""
+        rate = per_minute / 60
+        burst = burst or max(1, per_minute // 2)
+
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapped(*args, **kwargs):
+                if self.app.config['RATELIMIT_ENABLED']:
+                    allowed, retry_after = self.backend.take(f"{name}:{request.remote_addr}", rate, burst)
+                    if not allowed:
+                        return too_many_requests(retry_after)
+                return view(*args, **kwargs)
+            return wrapped
+        return decorator
+
+
+class UpstreamGate:
+    """Caps concurrent upstream fetches across all requests in this process."""
+
+    def __init__(self, max_concurrency=16, timeout=2.0):
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.timeout = timeout
+
+    def __enter__(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise UpstreamBusy(retry_after=max(1, math.ceil(self.timeout)))
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
+        return False
+
+
+def too_many_requests(retry_after):
+    """429 with Retry-After — JSON for /api/ callers, a page for everyone else."""
+    seconds = max(1, math.ceil(retry_after))
+    if request.path.startswith('/api/'):
+        response = make_response(jsonify({'error': 'Too many requests', 'retry_after': seconds}), 429)
+    else:
+        response = make_response(render_template('429.html', retry_after=seconds,
+                                                 title="طلبات كثيرة"), 429)
+    response.headers['Retry-After'] = str(seconds)
+    return response
@@ -0,0 +1,39 @@
+"""
+Production launcher: gunicorn with gunicorn.conf.py.
+
+    python serve.py                    # PORT, WEB_CONCURRENCY, THREADS from the env
+
+Gunicorn needs a POSIX system; elsewhere this falls back to waitress if it
+is installed, and finally to Flask's threaded server with debug off.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    try:
+        from gunicorn.app.wsgiapp import run
+    except ImportError:
+        run = None
+    if run is not None:
+        sys.argv = ['gunicorn', '-c', os.path.join(ROOT, 'gunicorn.conf.py'), '--chdir', ROOT, 'wsgi:app']
+        run()
+        return
+
+    from wsgi import app
+    host = os.environ.get('HOST', '0.0.0.0')
+    port = int(os.environ.get('PORT', 5000))
+    try:
+        from waitress import serve
+    except ImportError:
+        app.logger.warning("gunicorn/waitress not installed; using Flask's server")
+        app.run(host=host, port=port, threaded=True, debug=False)
+        return
+    serve(app, host=host, port=port, threads=int(os.environ.get('THREADS', 8)))
+
+
+if __name__ == '__main__':
+    main()
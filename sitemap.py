@@ -0,0 +1,104 @@
+"""
+Sitemap generation — sharded <urlset> files behind a <sitemapindex>.
+
+Each shard is rendered once, stored plain and gzipped, and served from
+memory until its TTL runs out, so crawlers never trigger a rebuild of the
+whole map. Shards longer than the protocol's 50,000-URL limit are split
+into numbered pages.
+"""
+
+import gzip
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+MAX_URLS = 50000
+XMLNS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def w3c_date(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%d')
+
+
+def page_count(n):
+    return max(1, math.ceil(n / MAX_URLS))
+
+
+def paginate(entries, page):
+    """Entries for 1-based shard page `page`, or None past the end."""
+    if not 1 <= page <= page_count(len(entries)):
+        return None
+    return entries[(page - 1) * MAX_URLS:page * MAX_URLS]
+
+
+def render_urlset(entries):
+    """entries: iterable of (loc, lastmod_ts or None, changefreq, priority)."""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n', f'<urlset xmlns="{XMLNS}">\n']
+    for loc, lastmod, changefreq, priority in entries:
+        parts.append(f"  <url><loc>{escape(loc)}</loc>")
+        if lastmod:
+            parts.append(f"<lastmod>{w3c_date(lastmod)}</lastmod>")
+        parts.append(f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>\n")
+    parts.append('</urlset>')
+    return ''.join(parts)
+
+
+def render_index(entries):
+    """entries: iterable of (loc, lastmod_ts or None)."""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n', f'<sitemapindex xmlns="{XMLNS}">\n']
+    for loc, lastmod in entries:
+        parts.append(f"  <sitemap><loc>{escape(loc)}</loc>")
+        if lastmod:
+            parts.append(f"<lastmod>{w3c_date(lastmod)}</lastmod>")
+        parts.append("</sitemap>\n")
+    parts.append('</sitemapindex>')
+    return ''.join(parts)
+
+
+class SitemapCache:
+    """Rendered documents keyed by (base URL, shard, page): (built_at, ttl, xml, gzipped xml).
+
+    Each key builds under its own lock, so a slow shard (one whose entries
+    come from upstream) never holds up the others.
+    """
+
+    def __init__(self, max_entries=256):
+        self._entries = {}
+        self._building = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, key, build):
+        """Cached document for `key`; `build()` returns (xml, ttl) or None if there is nothing to serve."""
+        hit = self._entries.get(key)
+        if hit and time.time() - hit[0] < hit[1]:
+            return hit
+        with self._lock:
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            hit = self._entries.get(key)
+            if hit and time.time() - hit[0] < hit[1]:
+                return hit
+            built = build()
+            if built is None:
+                with self._lock:
+                    if key not in self._entries:
+                        self._building.pop(key, None)
+                return None
+            xml, ttl = built
+            body = xml.encode('utf-8')
+            entry = (time.time(), ttl, body, gzip.compress(body, compresslevel=6, mtime=0))
+            with self._lock:
+                if key not in self._entries and len(self._entries) >= self.max_entries:
+                    # Evict the oldest document rather than the whole map
+                    oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                    del self._entries[oldest]
+                    self._building.pop(oldest, None)
+                self._entries[key] = entry
+            return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
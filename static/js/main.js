@@ -151,7 +151,12 @@ document.addEventListener('DOMContentLoaded', function () {
 // ── Service Worker Registration (PWA) ─────────────────────────
 if ('serviceWorker' in navigator) {
     window.addEventListener('load', function () {
-        navigator.serviceWorker.register('/static/sw.js').catch(function () {
+        // Served from the root so its scope covers every page
+        navigator.serviceWorker.register('/sw.js').then(function (reg) {
+            // Pick up a new offline bundle, if one was published
+            const sw = reg.active || reg.waiting || reg.installing;
+            if (sw) sw.postMessage('sync-offline');
+        }).catch(function () {
             // Service worker registration failed - not critical
         });
     });
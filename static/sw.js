@@ -1,9 +1,17 @@
 // Service Worker for offline caching
-const CACHE_NAME = 'islamic-v1';
+// Filled in by the /sw.js route from the static asset hashes, so every
+// asset change yields a new cache and the old one is dropped on activate
+const ASSET_VERSION = 'dev';
+const ASSET_URLS = {};
+const asset = path => ASSET_URLS[path] || `/static/${path}`;
+
+const CACHE_NAME = `islamic-${ASSET_VERSION}`;
+const BUNDLE_CACHE = 'islamic-offline';
+const MANIFEST_URL = '/offline/manifest.json';
 const STATIC_ASSETS = [
     '/',
-    '/static/css/main.css',
-    '/static/js/main.js',
+    asset('css/main.css'),
+    asset('js/main.js'),
     '/quran',
     '/hadith',
 ];
@@ -14,7 +22,131 @@ self.addEventListener('install', event => {
     );
 });
 
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(k => k !== CACHE_NAME && k !== BUNDLE_CACHE).map(k => caches.delete(k))
+            ))
+            .then(() => syncBundle())
+    );
+});
+
+self.addEventListener('message', event => {
+    if (event.data === 'sync-offline') {
+        event.waitUntil(syncBundle());
+    }
+});
+
+// ── Offline bundle ────────────────────────────────────────────
+// The manifest lists content-hashed chunk files; only files we don't
+// already hold are downloaded, and chunks dropped from the manifest are
+// deleted, so an update costs just the chunks that changed.
+let _syncing = null;
+function syncBundle() {
+    if (_syncing) return _syncing;
+    _syncing = (async () => {
+        const cache = await caches.open(BUNDLE_CACHE);
+        const res = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!res.ok) return;
+        const manifest = await res.clone().json();
+        const old = await cache.match(MANIFEST_URL);
+        if (old && (await old.json()).version === manifest.version) return;
+
+        const wanted = new Set(manifest.chunks.map(c => `/offline/${c.file}`));
+        const have = new Set((await cache.keys()).map(r => new URL(r.url).pathname));
+        const missing = [...wanted].filter(u => !have.has(u));
+        await cache.addAll(missing);
+        await Promise.all(
+            [...have].filter(u => u !== MANIFEST_URL && !wanted.has(u)).map(u => cache.delete(u))
+        );
+        await cache.put(MANIFEST_URL, res);
+    })().catch(() => { }).finally(() => { _syncing = null; });
+    return _syncing;
+}
+
+async function bundleManifest() {
+    const res = await (await caches.open(BUNDLE_CACHE)).match(MANIFEST_URL);
+    return res ? res.json() : null;
+}
+
+async function bundleChunk(kind, edition, globalNumber) {
+    const cache = await caches.open(BUNDLE_CACHE);
+    const manifest = await bundleManifest();
+    if (!manifest) return null;
+    const entry = manifest.chunks.find(c => c.kind === kind &&
+        (!edition || c.edition === edition) &&
+        (!globalNumber || (c.start <= globalNumber && globalNumber <= c.end)));
+    if (!entry) return null;
+    const chunk = await cache.match(`/offline/${entry.file}`);
+    return chunk ? chunk.json() : null;
+}
+
+// Texts of global ayat first..last of one bundled edition, or null
+async function bundleTexts(edition, first, last) {
+    const texts = [];
+    for (let g = first; g <= last;) {
+        const chunk = await bundleChunk('quran', edition, g);
+        if (!chunk) return null;
+        const end = Math.min(last, chunk.start + chunk.texts.length - 1);
+        for (; g <= end; g++) texts.push(chunk.texts[g - chunk.start]);
+    }
+    return texts;
+}
+
+// Minimal surah page rendered from the bundle when the network is gone
+async function offlineSurahPage(surahId) {
+    const meta = await bundleChunk('meta');
+    if (!meta || surahId < 1 || surahId > meta.surahs.length) return null;
+    const surah = meta.surahs[surahId - 1];
+    const first = meta.surahs.slice(0, surahId - 1).reduce((n, s) => n + s.verses, 0) + 1;
+    const last = first + surah.verses - 1;
+
+    const verses = await bundleTexts('quran-uthmani', first, last);
+    if (!verses) return null;
+    // First bundled translation, shown under each ayah when present
+    const manifest = await bundleManifest();
+    const extra = manifest && manifest.chunks.find(c => c.kind === 'quran' && c.edition !== 'quran-uthmani');
+    const translations = extra ? await bundleTexts(extra.edition, first, last) : null;
+
+    const escape = s => s.replace(/[&<>"]/g, ch => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }[ch]));
+    const body = verses.map((text, i) =>
+        `<div class="verse-card"><div class="verse-num">${i + 1}</div><p class="verse-text">${escape(text)}</p>` +
+        (translations && translations[i] ? `<div class="verse-translation" dir="auto">${escape(translations[i])}</div>` : '') +
+        `</div>`
+    ).join('');
+    const html = `<!DOCTYPE html><html lang="ar" dir="rtl" data-theme="dark"><head><meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0"><title>سورة ${escape(surah.name)} | إسلامي</title>
+<link rel="stylesheet" href="${asset('css/main.css')}"></head><body><main>
+<div class="surah-header"><div class="container-narrow"><h1>${escape(surah.name)}</h1>
+<p class="text-secondary">${escape(surah.name_en)} — وضع عدم الاتصال</p></div></div>
+<div class="container-narrow">${body}</div></main></body></html>`;
+    return new Response(html, { headers: { 'Content-Type': 'text/html; charset=utf-8' } });
+}
+
 self.addEventListener('fetch', event => {
+    const url = new URL(event.request.url);
+
+    // Offline bundle files are immutable (content-hashed): cache-first
+    if (url.origin === location.origin && url.pathname.startsWith('/offline/') && url.pathname !== MANIFEST_URL) {
+        event.respondWith(
+            caches.match(event.request).then(cached => cached || fetch(event.request))
+        );
+        return;
+    }
+
+    // Surah pages fall back to the bundle when offline and not cached
+    const surahMatch = url.origin === location.origin && url.pathname.match(/^\/quran\/(\d+)$/);
+    if (event.request.mode === 'navigate' && surahMatch) {
+        event.respondWith(
+            fetch(event.request)
+                .catch(() => caches.match(event.request)
+                    .then(cached => cached || offlineSurahPage(parseInt(surahMatch[1], 10)))
+                    .then(res => res || caches.match('/quran')))
+        );
+        return;
+    }
+
     // Network-first for API calls, cache-first for static
     if (event.request.url.includes('/api/') || event.request.url.includes('cdn.jsdelivr.net') || event.request.url.includes('api.alquran.cloud')) {
         event.respondWith(
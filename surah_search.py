@@ -0,0 +1,111 @@
+"""
+Surah lookup — a trigram index over Arabic names, English names, meanings
+and common transliterations, with ranked fuzzy matching.
+
+Both the index and queries go through the same normalization, so spelling
+variants ("baqara", "al baqarah", "البقره", unvowelled Arabic) land on the
+same trigrams. The app builds the index on the first lookup and keeps it;
+a query touches only the postings of its own trigrams.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+
+_AR_DIACRITICS = re.compile('[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+_AR_CHARS = re.compile('[\u0600-\u06FF]')
+_AR_LETTERS = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ة': 'ه', 'ى': 'ي', 'ؤ': 'و', 'ئ': 'ي'})
+_LATIN_ARTICLES = {'al', 'an', 'ar', 'as', 'at', 'ad', 'az', 'ash', 'adh', 'ath', 'surah', 'surat', 'sura'}
+_LATIN_VOWELS = [('aa', 'a'), ('ee', 'i'), ('ii', 'i'), ('oo', 'u'), ('uu', 'u'), ('ou', 'u'), ('e', 'a'), ('o', 'u')]
+
+MIN_SCORE = 0.3
+
+
+def is_arabic(text):
+    return bool(_AR_CHARS.search(text))
+
+
+def normalize_ar(text):
+    """Strip harakat/tatweel, unify alef/ta marbuta/ya forms, drop the article."""
+    text = _AR_DIACRITICS.sub('', text).translate(_AR_LETTERS)
+    words = [w[2:] if w.startswith('ال') and len(w) > 3 else w for w in re.split(r'\s+', text.strip())]
+    words = [w for w in words if w and w != 'سوره']
+    return ''.join(words)
+
+
+def normalize_latin(text, keep_article=False):
+    """Lowercase ASCII skeleton: no accents, punctuation, articles or doubled letters."""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if c.isascii() and (c.isalnum() or c in " -'`"))
+    words = [w for w in re.split(r"[\s\-'`]+", text) if w]
+    if not keep_article:
+        words = [w for w in words if w not in _LATIN_ARTICLES] or words
+    text = ''.join(words)
+    for a, b in _LATIN_VOWELS:
+        text = text.replace(a, b)
+    text = re.sub(r'(.)\1+', r'\1', text)
+    if len(text) > 3 and text.endswith('h') and text[-2] in 'aiu':
+        text = text[:-1]
+    return text
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SurahIndex:
+    """Inverted trigram index; each surah owns several normalized forms."""
+
+    def __init__(self, surahs_meta, aliases=None):
+        self.surahs = surahs_meta
+        self.forms = []        # (surah_id, normalized form, trigram count)
+        self.postings = defaultdict(list)
+        for s in surahs_meta:
+            ar = {normalize_ar(s['name'])}
+            latin = {s['name_en'], s['meaning'], *(aliases or {}).get(s['id'], ())}
+            forms = ar | {normalize_latin(t) for t in latin} | {normalize_latin(t, keep_article=True) for t in latin}
+            for form in forms:
+                if not form:
+                    continue
+                grams = trigrams(form)
+                form_id = len(self.forms)
+                self.forms.append((s['id'], form, len(grams)))
+                for gram in grams:
+                    self.postings[gram].append(form_id)
+        self.search = lru_cache(maxsize=2048)(self._search)
+
+    def _search(self, query, limit=10):
+        """Ranked list of (surah_meta, score), best first."""
+        query = query.strip()[:100]
+        if not query:
+            return ()
+        if query.isdigit():
+            hits = [s for s in self.surahs if str(s['id']).startswith(query)]
+            hits.sort(key=lambda s: (str(s['id']) != query, s['id']))
+            return tuple((s, 1.0) for s in hits[:limit])
+
+        norm = normalize_ar(query) if is_arabic(query) else normalize_latin(query)
+        if not norm:
+            return ()
+        qgrams = trigrams(norm)
+        shared = defaultdict(int)
+        for gram in qgrams:
+            for form_id in self.postings.get(gram, ()):
+                shared[form_id] += 1
+
+        best = {}
+        for form_id, n in shared.items():
+            surah_id, form, size = self.forms[form_id]
+            score = 2 * n / (len(qgrams) + size)  # Dice coefficient
+            if form == norm:
+                score += 1.0
+            elif form.startswith(norm) or norm in form:
+                score += 0.5
+            if score > best.get(surah_id, 0):
+                best[surah_id] = score
+
+        ranked = sorted(best.items(), key=lambda kv: (-kv[1], kv[0]))
+        return tuple((self.surahs[sid - 1], round(score, 3))
+                     for sid, score in ranked[:limit] if score >= MIN_SCORE)
@@ -0,0 +1,300 @@
+"""
+Static data tables — surah metadata, hadith collections, translations,
+reciters and Arabic hadith section names.
+
+Plain literals, moved out of app.py: the module is byte-compiled once
+(`python -m compileall`) and imports in well under a millisecond.
+"""
+
+SURAHS_META = [
+    {"id":1,"name":"الفاتحة","name_en":"Al-Fatihah","meaning":"The Opening","verses":7,"type":"meccan"},
+    {"id":2,"name":"البقرة","name_en":"Al-Baqarah","meaning":"The Cow","verses":286,"type":"medinan"},
+    {"id":3,"name":"آل عمران","name_en":"Ali 'Imran","meaning":"Family of Imran","verses":200,"type":"medinan"},
+    {"id":4,"name":"النساء","name_en":"An-Nisa","meaning":"The Women","verses":176,"type":"medinan"},
+    {"id":5,"name":"المائدة","name_en":"Al-Ma'idah","meaning":"The Table Spread","verses":120,"type":"medinan"},
+    {"id":6,"name":"الأنعام","name_en":"Al-An'am","meaning":"The Cattle","verses":165,"type":"meccan"},
+    {"id":7,"name":"الأعراف","name_en":"Al-A'raf","meaning":"The Heights","verses":206,"type":"meccan"},
+    {"id":8,"name":"الأنفال","name_en":"Al-Anfal","meaning":"The Spoils of War","verses":75,"type":"medinan"},
+    {"id":9,"name":"التوبة","name_en":"At-Tawbah","meaning":"The Repentance","verses":129,"type":"medinan"},
+    {"id":10,"name":"يونس","name_en":"Yunus","meaning":"Jonah","verses":109,"type":"meccan"},
+    {"id":11,"name":"هود","name_en":"Hud","meaning":"Hud","verses":123,"type":"meccan"},
+    {"id":12,"name":"يوسف","name_en":"Yusuf","meaning":"Joseph","verses":111,"type":"meccan"},
+    {"id":13,"name":"الرعد","name_en":"Ar-Ra'd","meaning":"The Thunder","verses":43,"type":"medinan"},
+    {"id":14,"name":"إبراهيم","name_en":"Ibrahim","meaning":"Abraham","verses":52,"type":"meccan"},
+    {"id":15,"name":"الحجر","name_en":"Al-Hijr","meaning":"The Rocky Tract","verses":99,"type":"meccan"},
+    {"id":16,"name":"النحل","name_en":"An-Nahl","meaning":"The Bee","verses":128,"type":"meccan"},
+    {"id":17,"name":"الإسراء","name_en":"Al-Isra","meaning":"The Night Journey","verses":111,"type":"meccan"},
+    {"id":18,"name":"الكهف","name_en":"Al-Kahf","meaning":"The Cave","verses":110,"type":"meccan"},
+    {"id":19,"name":"مريم","name_en":"Maryam","meaning":"Mary","verses":98,"type":"meccan"},
+    {"id":20,"name":"طه","name_en":"Taha","meaning":"Ta-Ha","verses":135,"type":"meccan"},
+    {"id":21,"name":"الأنبياء","name_en":"Al-Anbiya","meaning":"The Prophets","verses":112,"type":"meccan"},
+    {"id":22,"name":"الحج","name_en":"Al-Hajj","meaning":"The Pilgrimage","verses":78,"type":"medinan"},
+    {"id":23,"name":"المؤمنون","name_en":"Al-Mu'minun","meaning":"The Believers","verses":118,"type":"meccan"},
+    {"id":24,"name":"النور","name_en":"An-Nur","meaning":"The Light","verses":64,"type":"medinan"},
+    {"id":25,"name":"الفرقان","name_en":"Al-Furqan","meaning":"The Criterion","verses":77,"type":"meccan"},
+    {"id":26,"name":"الشعراء","name_en":"Ash-Shu'ara","meaning":"The Poets","verses":227,"type":"meccan"},
+    {"id":27,"name":"النمل","name_en":"An-Naml","meaning":"The Ant","verses":93,"type":"meccan"},
+    {"id":28,"name":"القصص","name_en":"Al-Qasas","meaning":"The Stories","verses":88,"type":"meccan"},
+    {"id":29,"name":"العنكبوت","name_en":"Al-Ankabut","meaning":"The Spider","verses":69,"type":"meccan"},
+    {"id":30,"name":"الروم","name_en":"Ar-Rum","meaning":"The Romans","verses":60,"type":"meccan"},
+    {"id":31,"name":"لقمان","name_en":"Luqman","meaning":"Luqman","verses":34,"type":"meccan"},
+    {"id":32,"name":"السجدة","name_en":"As-Sajdah","meaning":"The Prostration","verses":30,"type":"meccan"},
+    {"id":33,"name":"الأحزاب","name_en":"Al-Ahzab","meaning":"The Combined Forces","verses":73,"type":"medinan"},
+    {"id":34,"name":"سبأ","name_en":"Saba","meaning":"Sheba","verses":54,"type":"meccan"},
+    {"id":35,"name":"فاطر","name_en":"Fatir","meaning":"Originator","verses":45,"type":"meccan"},
+    {"id":36,"name":"يس","name_en":"Ya-Sin","meaning":"Ya Sin","verses":83,"type":"meccan"},
+    {"id":37,"name":"الصافات","name_en":"As-Saffat","meaning":"Those Ranged in Ranks","verses":182,"type":"meccan"},
+    {"id":38,"name":"ص","name_en":"Sad","meaning":"The Letter Sad","verses":88,"type":"meccan"},
+    {"id":39,"name":"الزمر","name_en":"Az-Zumar","meaning":"The Groups","verses":75,"type":"meccan"},
+    {"id":40,"name":"غافر","name_en":"Ghafir","meaning":"The Forgiver","verses":85,"type":"meccan"},
+    {"id":41,"name":"فصلت","name_en":"Fussilat","meaning":"Explained in Detail","verses":54,"type":"meccan"},
+    {"id":42,"name":"الشورى","name_en":"Ash-Shura","meaning":"The Consultation","verses":53,"type":"meccan"},
+    {"id":43,"name":"الزخرف","name_en":"Az-Zukhruf","meaning":"The Ornaments of Gold","verses":89,"type":"meccan"},
+    {"id":44,"name":"الدخان","name_en":"Ad-Dukhan","meaning":"The Smoke","verses":59,"type":"meccan"},
+    {"id":45,"name":"الجاثية","name_en":"Al-Jathiyah","meaning":"The Crouching","verses":37,"type":"meccan"},
+    {"id":46,"name":"الأحقاف","name_en":"Al-Ahqaf","meaning":"The Wind-Curved Sandhills","verses":35,"type":"meccan"},
+    {"id":47,"name":"محمد","name_en":"Muhammad","meaning":"Muhammad","verses":38,"type":"medinan"},
+    {"id":48,"name":"الفتح","name_en":"Al-Fath","meaning":"The Victory","verses":29,"type":"medinan"},
+    {"id":49,"name":"الحجرات","name_en":"Al-Hujurat","meaning":"The Rooms","verses":18,"type":"medinan"},
+    {"id":50,"name":"ق","name_en":"Qaf","meaning":"The Letter Qaf","verses":45,"type":"meccan"},
+    {"id":51,"name":"الذاريات","name_en":"Adh-Dhariyat","meaning":"The Winnowing Winds","verses":60,"type":"meccan"},
+    {"id":52,"name":"الطور","name_en":"At-Tur","meaning":"The Mount","verses":49,"type":"meccan"},
+    {"id":53,"name":"النجم","name_en":"An-Najm","meaning":"The Star","verses":62,"type":"meccan"},
+    {"id":54,"name":"القمر","name_en":"Al-Qamar","meaning":"The Moon","verses":55,"type":"meccan"},
+    {"id":55,"name":"الرحمن","name_en":"Ar-Rahman","meaning":"The Beneficent","verses":78,"type":"medinan"},
+    {"id":56,"name":"الواقعة","name_en":"Al-Waqi'ah","meaning":"The Inevitable","verses":96,"type":"meccan"},
+    {"id":57,"name":"الحديد","name_en":"Al-Hadid","meaning":"The Iron","verses":29,"type":"medinan"},
+    {"id":58,"name":"المجادلة","name_en":"Al-Mujadila","meaning":"She That Disputeth","verses":22,"type":"medinan"},
+    {"id":59,"name":"الحشر","name_en":"Al-Hashr","meaning":"The Exile","verses":24,"type":"medinan"},
+    {"id":60,"name":"الممتحنة","name_en":"Al-Mumtahanah","meaning":"She That Is Examined","verses":13,"type":"medinan"},
+    {"id":61,"name":"الصف","name_en":"As-Saf","meaning":"The Ranks","verses":14,"type":"medinan"},
+    {"id":62,"name":"الجمعة","name_en":"Al-Jumu'ah","meaning":"The Congregation","verses":11,"type":"medinan"},
+    {"id":63,"name":"المنافقون","name_en":"Al-Munafiqun","meaning":"The Hypocrites","verses":11,"type":"medinan"},
+    {"id":64,"name":"التغابن","name_en":"At-Taghabun","meaning":"The Mutual Disillusion","verses":18,"type":"medinan"},
+    {"id":65,"name":"الطلاق","name_en":"At-Talaq","meaning":"The Divorce","verses":12,"type":"medinan"},
+    {"id":66,"name":"التحريم","name_en":"At-Tahrim","meaning":"The Prohibition","verses":12,"type":"medinan"},
+    {"id":67,"name":"الملك","name_en":"Al-Mulk","meaning":"The Sovereignty","verses":30,"type":"meccan"},
+    {"id":68,"name":"القلم","name_en":"Al-Qalam","meaning":"The Pen","verses":52,"type":"meccan"},
+    {"id":69,"name":"الحاقة","name_en":"Al-Haqqah","meaning":"The Reality","verses":52,"type":"meccan"},
+    {"id":70,"name":"المعارج","name_en":"Al-Ma'arij","meaning":"The Ascending Stairways","verses":44,"type":"meccan"},
+    {"id":71,"name":"نوح","name_en":"Nuh","meaning":"Noah","verses":28,"type":"meccan"},
+    {"id":72,"name":"الجن","name_en":"Al-Jinn","meaning":"The Jinn","verses":28,"type":"meccan"},
+    {"id":73,"name":"المزمل","name_en":"Al-Muzzammil","meaning":"The Enshrouded One","verses":20,"type":"meccan"},
+    {"id":74,"name":"المدثر","name_en":"Al-Muddaththir","meaning":"The Cloaked One","verses":56,"type":"meccan"},
+    {"id":75,"name":"القيامة","name_en":"Al-Qiyamah","meaning":"The Resurrection","verses":40,"type":"meccan"},
+    {"id":76,"name":"الإنسان","name_en":"Al-Insan","meaning":"The Man","verses":31,"type":"medinan"},
+    {"id":77,"name":"المرسلات","name_en":"Al-Mursalat","meaning":"The Emissaries","verses":50,"type":"meccan"},
+    {"id":78,"name":"النبأ","name_en":"An-Naba","meaning":"The Tidings","verses":40,"type":"meccan"},
+    {"id":79,"name":"النازعات","name_en":"An-Nazi'at","meaning":"Those Who Drag Forth","verses":46,"type":"meccan"},
+    {"id":80,"name":"عبس","name_en":"Abasa","meaning":"He Frowned","verses":42,"type":"meccan"},
+    {"id":81,"name":"التكوير","name_en":"At-Takwir","meaning":"The Overthrowing","verses":29,"type":"meccan"},
+    {"id":82,"name":"الانفطار","name_en":"Al-Infitar","meaning":"The Cleaving","verses":19,"type":"meccan"},
+    {"id":83,"name":"المطففين","name_en":"Al-Mutaffifin","meaning":"Defrauding","verses":36,"type":"meccan"},
+    {"id":84,"name":"الانشقاق","name_en":"Al-Inshiqaq","meaning":"The Sundering","verses":25,"type":"meccan"},
+    {"id":85,"name":"البروج","name_en":"Al-Buruj","meaning":"The Mansions of the Stars","verses":22,"type":"meccan"},
+    {"id":86,"name":"الطارق","name_en":"At-Tariq","meaning":"The Nightcomer","verses":17,"type":"meccan"},
+    {"id":87,"name":"الأعلى","name_en":"Al-A'la","meaning":"The Most High","verses":19,"type":"meccan"},
+    {"id":88,"name":"الغاشية","name_en":"Al-Ghashiyah","meaning":"The Overwhelming","verses":26,"type":"meccan"},
+    {"id":89,"name":"الفجر","name_en":"Al-Fajr","meaning":"The Dawn","verses":30,"type":"meccan"},
+    {"id":90,"name":"البلد","name_en":"Al-Balad","meaning":"The City","verses":20,"type":"meccan"},
+    {"id":91,"name":"الشمس","name_en":"Ash-Shams","meaning":"The Sun","verses":15,"type":"meccan"},
+    {"id":92,"name":"الليل","name_en":"Al-Layl","meaning":"The Night","verses":21,"type":"meccan"},
+    {"id":93,"name":"الضحى","name_en":"Ad-Duhaa","meaning":"The Morning Hours","verses":11,"type":"meccan"},
+    {"id":94,"name":"الشرح","name_en":"Ash-Sharh","meaning":"The Relief","verses":8,"type":"meccan"},
+    {"id":95,"name":"التين","name_en":"At-Tin","meaning":"The Fig","verses":8,"type":"meccan"},
+    {"id":96,"name":"العلق","name_en":"Al-Alaq","meaning":"The Clot","verses":19,"type":"meccan"},
+    {"id":97,"name":"القدر","name_en":"Al-Qadr","meaning":"The Power","verses":5,"type":"meccan"},
+    {"id":98,"name":"البينة","name_en":"Al-Bayyinah","meaning":"The Clear Proof","verses":8,"type":"medinan"},
+    {"id":99,"name":"الزلزلة","name_en":"Az-Zalzalah","meaning":"The Earthquake","verses":8,"type":"medinan"},
+    {"id":100,"name":"العاديات","name_en":"Al-Adiyat","meaning":"The Chargers","verses":11,"type":"meccan"},
+    {"id":101,"name":"القارعة","name_en":"Al-Qari'ah","meaning":"The Calamity","verses":11,"type":"meccan"},
+    {"id":102,"name":"التكاثر","name_en":"At-Takathur","meaning":"The Rivalry in Worldly Increase","verses":8,"type":"meccan"},
+    {"id":103,"name":"العصر","name_en":"Al-Asr","meaning":"The Declining Day","verses":3,"type":"meccan"},
+    {"id":104,"name":"الهمزة","name_en":"Al-Humazah","meaning":"The Traducer","verses":9,"type":"meccan"},
+    {"id":105,"name":"الفيل","name_en":"Al-Fil","meaning":"The Elephant","verses":5,"type":"meccan"},
+    {"id":106,"name":"قريش","name_en":"Quraysh","meaning":"Quraysh","verses":4,"type":"meccan"},
+    {"id":107,"name":"الماعون","name_en":"Al-Ma'un","meaning":"The Small Kindnesses","verses":7,"type":"meccan"},
+    {"id":108,"name":"الكوثر","name_en":"Al-Kawthar","meaning":"The Abundance","verses":3,"type":"meccan"},
+    {"id":109,"name":"الكافرون","name_en":"Al-Kafirun","meaning":"The Disbelievers","verses":6,"type":"meccan"},
+    {"id":110,"name":"النصر","name_en":"An-Nasr","meaning":"The Divine Support","verses":3,"type":"medinan"},
+    {"id":111,"name":"المسد","name_en":"Al-Masad","meaning":"The Palm Fiber","verses":5,"type":"meccan"},
+    {"id":112,"name":"الإخلاص","name_en":"Al-Ikhlas","meaning":"The Sincerity","verses":4,"type":"meccan"},
+    {"id":113,"name":"الفلق","name_en":"Al-Falaq","meaning":"The Daybreak","verses":5,"type":"meccan"},
+    {"id":114,"name":"الناس","name_en":"An-Nas","meaning":"Mankind","verses":6,"type":"meccan"},
+]
+
+# Other names / spellings a surah is commonly searched by (surah_search.py)
+SURAH_ALIASES = {
+    1: ["Fatiha", "Umm al-Kitab"],
+    2: ["Baqara"],
+    9: ["Bara'ah"],
+    17: ["Bani Isra'il"],
+    20: ["Ta Ha"],
+    36: ["Yaseen", "Yasin"],
+    40: ["Al-Mu'min"],
+    41: ["Ha Mim Sajdah"],
+    47: ["Al-Qital"],
+    55: ["Rahman"],
+    76: ["Ad-Dahr"],
+    94: ["Al-Inshirah", "Alam Nashrah"],
+    112: ["At-Tawhid"],
+    113: ["Falaq"],
+    114: ["Naas"],
+}
+
+HADITH_COLLECTIONS = [
+    {"id": "ara-bukhari", "name": "صحيح البخاري", "name_en": "Sahih al-Bukhari", "author": "الإمام البخاري", "count": "7563"},
+    {"id": "ara-muslim", "name": "صحيح مسلم", "name_en": "Sahih Muslim", "author": "الإمام مسلم", "count": "5362"},
+    {"id": "ara-abudawud", "name": "سنن أبي داود", "name_en": "Sunan Abu Dawud", "author": "أبو داود", "count": "4590"},
+    {"id": "ara-tirmidhi", "name": "جامع الترمذي", "name_en": "Jami at-Tirmidhi", "author": "الإمام الترمذي", "count": "3891"},
+    {"id": "ara-nasai", "name": "سنن النسائي", "name_en": "Sunan an-Nasa'i", "author": "الإمام النسائي", "count": "5662"},
+    {"id": "ara-ibnmajah", "name": "سنن ابن ماجه", "name_en": "Sunan Ibn Majah", "author": "ابن ماجه", "count": "4332"},
+]
+
+TRANSLATION_MAP = {
+    'en.sahih': 'English — Saheeh International',
+    'en.hilali': 'English — Hilali & Khan',
+    'fr.hamidullah': 'Français — Hamidullah',
+    'ur.jalandhry': 'اردو — Jalandhry',
+    'tr.diyanet': 'Türkçe — Diyanet',
+    'id.indonesian': 'Bahasa Indonesia',
+    'de.bubenheim': 'Deutsch — Bubenheim',
+    'es.cortes': 'Español — Cortes',
+    'ru.kuliev': 'Русский — Kuliev',
+    'bn.bengali': 'বাংলা — Bengali',
+}
+
+# Tafsir editions that can sit beside translations in the parallel view
+TAFSIR_MAP = {
+    'ar.muyassar': 'العربية — التفسير الميسر',
+    'ar.ibnkathir': 'العربية — تفسير ابن كثير',
+    'ar.saddi': 'العربية — تفسير السعدي',
+}
+
+# Per-surah sources for tafsir editions not published on alquran.cloud.
+# {ref} is the spa5k/tafsir_api revision (TAFSIR_API_REF): a commit hash
+# pins the text, a branch name follows upstream edits.
+TAFSIR_SOURCES = {
+    'ar.ibnkathir': 'https://cdn.jsdelivr.net/gh/spa5k/tafsir_api@{ref}/tafsir/ar-tafsir-ibn-kathir/{surah}.json',
+    'ar.saddi': 'https://cdn.jsdelivr.net/gh/spa5k/tafsir_api@{ref}/tafsir/ar-tafseer-al-saddi/{surah}.json',
+}
+
+RECITERS = [
+    {"id": "ar.alafasy", "name": "مشاري العفاسي", "name_en": "Mishary Rashid Alafasy"},
+    {"id": "ar.abdulbasitmurattal", "name": "عبد الباسط عبد الصمد", "name_en": "Abdul Basit (Murattal)"},
+    {"id": "ar.abdullahbasfar", "name": "عبدالله بصفر", "name_en": "Abdullah Basfar"},
+    {"id": "ar.hudhaify", "name": "الحذيفي", "name_en": "Ali Al-Hudhaifi"},
+    {"id": "ar.husary", "name": "محمود خليل الحصري", "name_en": "Mahmoud Khalil Al-Husary"},
+    {"id": "ar.mahermuaiqly", "name": "ماهر المعيقلي", "name_en": "Maher Al Muaiqly"},
+    {"id": "ar.abdurrahmaansudais", "name": "عبدالرحمن السديس", "name_en": "Abdurrahmaan As-Sudais"},
+    {"id": "ar.saoodshuraym", "name": "سعود الشريم", "name_en": "Saood Ash-Shuraym"},
+]
+
+# Arabic translations for Hadith section names (API returns English)
+HADITH_SECTIONS_AR = {
+    # Sahih al-Bukhari
+    "Revelation": "بدء الوحي",
+    "Belief": "الإيمان",
+    "Knowledge": "العلم",
+    "Ablutions (Wudu')": "الوضوء",
+    "Bathing (Ghusl)": "الغسل",
+    "Menstrual Periods": "الحيض",
+    "Rubbing hands and feet with dust (Tayammum)": "التيمم",
+    "Prayers (Salat)": "الصلاة",
+    "Times of the Prayers": "مواقيت الصلاة",
+    "Call to Prayers (Adhaan)": "الأذان",
+    "Friday Prayer": "الجمعة",
+    "Fear Prayer": "صلاة الخوف",
+    "The Two Festivals (Eids)": "العيدين",
+    "Witr Prayer": "الوتر",
+    "Invoking Allah for Rain (Istisqaa)": "الاستسقاء",
+    "Eclipses": "الكسوف",
+    "Prostration During Recital of Qur'an": "سجود القرآن",
+    "Shortening the Prayers (At-Taqseer)": "تقصير الصلاة",
+    "Prayer at Night (Tahajjud)": "التهجد",
+    "Virtues of Prayer at Masjid Makkah and Madinah": "فضل الصلاة في مسجد مكة والمدينة",
+    "Actions while Praying": "العمل في الصلاة",
+    "Forgetfulness in Prayer": "السهو",
+    "Funerals (Al-Janaa'iz)": "الجنائز",
+    "Obligatory Charity Tax (Zakat)": "الزكاة",
+    "Hajj (Pilgrimage)": "الحج",
+    "`Umrah (Minor pilgrimage)": "العمرة",
+    "Pilgrims Prevented from Completing the Pilgrimage": "المحصر",
+    "Penalty of Hunting while on Pilgrimage": "جزاء الصيد",
+    "Virtues of Madinah": "فضائل المدينة",
+    "Fasting": "الصيام",
+    "Praying at Night in Ramadaan (Taraweeh)": "التراويح",
+    "Virtues of the Night of Qadr": "فضل ليلة القدر",
+    "Retiring to a Mosque for Remembrance of Allah (I'tikaf)": "الاعتكاف",
+    "Sales and Trade": "البيوع",
+    "Hiring": "الإجارة",
+    "Agriculture": "المزارعة",
+    "Gifts": "الهبة",
+    "Witnesses": "الشهادات",
+    "Peacemaking": "الصلح",
+    "Wills and Testaments (Wasaayaa)": "الوصايا",
+    "Fighting for the Cause of Allah (Jihaad)": "الجهاد والسير",
+    "Beginning of Creation": "بدء الخلق",
+    "Prophets": "الأنبياء",
+    "Virtues and Merits of the Prophet (pbuh) and his Companions": "المناقب",
+    "Companions of the Prophet": "أصحاب النبي ﷺ",
+    "Merits of the Helpers in Madinah (Ansaar)": "مناقب الأنصار",
+    "Military Expeditions led by the Prophet (pbuh) (Al-Maghaazi)": "المغازي",
+    "Prophetic Commentary on the Qur'an (Tafseer of the Prophet (pbuh))": "التفسير",
+    "Virtues of the Qur'an": "فضائل القرآن",
+    "Wedlock, Marriage (Nikaah)": "النكاح",
+    "Divorce": "الطلاق",
+    "Supporting the Family": "النفقات",
+    "Food, Meals": "الأطعمة",
+    "Hunting, Slaughtering": "الصيد والذبائح",
+    "Drinks": "الأشربة",
+    "Patients": "المرضى",
+    "Medicine": "الطب",
+    "Dress": "اللباس",
+    "Good Manners and Form (Al-Adab)": "الأدب",
+    "Asking Permission": "الاستئذان",
+    "Invocations": "الدعوات",
+    "To make the Heart Tender (Ar-Riqaq)": "الرقاق",
+    "Divine Will (Al-Qadar)": "القدر",
+    "Oaths and Vows": "الأيمان والنذور",
+    "Laws of Inheritance (Al-Faraa'id)": "الفرائض",
+    "Limits and Punishments set by Allah (Hudood)": "الحدود",
+    "Blood Money (Ad-Diyat)": "الديات",
+    "Apostates": "المرتدين",
+    "Interpretation of Dreams": "تعبير الرؤيا",
+    "Afflictions and the End of the World": "الفتن",
+    "Judgments (Ahkaam)": "الأحكام",
+    "Holding Fast to the Qur'an and Sunnah": "الاعتصام بالكتاب والسنة",
+    "Oneness, Uniqueness of Allah (Tawheed)": "التوحيد",
+    # Sahih Muslim
+    "Introduction": "المقدمة",
+    "Faith": "الإيمان",
+    "Purification (Kitab Al-Taharah)": "الطهارة",
+    "Menstruation": "الحيض",
+    "Prayer": "الصلاة",
+    "Zakat": "الزكاة",
+    "Fasts": "الصيام",
+    "Pilgrimage": "الحج",
+    "Marriage": "النكاح",
+    "Suckling": "الرضاع",
+    "Transactions": "البيوع",
+    "Inheritance": "الفرائض",
+    "Gifts": "الهبة",
+    "Oaths": "الأيمان",
+    "Vows": "النذور",
+    "Oaths in Courts": "القسامة والمحاربين",
+    "Punishments": "الحدود",
+    "Hunting and Slaughter": "الصيد والذبائح",
+    "Food and Drink": "الأشربة",
+    "Clothing and Adornments": "اللباس والزينة",
+    "Jihad": "الجهاد والسير",
+    "Government": "الإمارة",
+    "Virtue, Enjoining Good Manners": "البر والصلة والآداب",
+    "Destiny": "القدر",
+    "Knowledge": "العلم",
+    "Remembrance of Allah": "الذكر والدعاء",
+    "Heart Melting Traditions": "التوبة",
+    "Paradise": "الجنة وصفة نعيمها وأهلها",
+    "Tribulations": "الفتن وأشراط الساعة",
+    "Commentary on the Quran": "تفسير القرآن",
+}
@@ -0,0 +1,15 @@
+"""
+WSGI entry point for production servers:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Importing this module loads the data sets, so with preload_app the work
+happens once in the master and is shared by every forked worker. With
+PRELOAD_FETCH=1 the corpora that data/ lacks are downloaded here too, and
+boot waits for them; otherwise each worker fetches them in the background
+on first use.
+"""
+
+from app import app, preload
+
+preload(fetch=app.config['PRELOAD_FETCH'])